@@ -0,0 +1,93 @@
+"""Clones of remote repositories kept between analyses.
+
+A repeat analysis of the same repository updates a pooled clone in place
+(one ``git fetch``) instead of cloning it again. Only idle clones sit in
+the pool: a checked-out clone is exclusively the caller's, and a second
+concurrent request for the same repository gets a fresh clone. Beyond
+``BRIDGE_CLONE_POOL`` idle clones (default 8, 0 disables the pool) the
+least recently used are deleted.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+_lock = threading.Lock()
+# clone URL -> path of an idle clone, least recently used first
+_idle: "OrderedDict[str, str]" = OrderedDict()
+
+
+def pool_size() -> int:
+    """Idle clones kept; ``BRIDGE_CLONE_POOL`` overrides the default."""
+    try:
+        return max(0, int(os.environ["BRIDGE_CLONE_POOL"]))
+    except (KeyError, ValueError):
+        return 8
+
+
+def discard(path: str) -> None:
+    """Delete ``path`` in the background so callers are not kept waiting.
+
+    Not a daemon thread: the interpreter waits for it at exit, so nothing
+    is left behind.
+    """
+    threading.Thread(target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, daemon=False).start()
+
+
+@contextmanager
+def checkout(
+    clone_url: str, clone: Callable[[str], None], update: Callable[[str], None]
+) -> Iterator[str]:
+    """Yield an up-to-date clone of ``clone_url``.
+
+    Reuses an idle pooled clone, refreshed with ``update(path)``, or makes
+    a new one with ``clone(path)``. The clone returns to the pool when the
+    block exits.
+    """
+    with _lock:
+        path = _idle.pop(clone_url, None)
+    if path is not None:
+        try:
+            update(path)
+        except Exception:
+            # A clone that cannot be refreshed is not worth repairing
+            discard(path)
+            path = None
+    if path is None:
+        path = tempfile.mkdtemp(prefix="bridge-cli-")
+        try:
+            clone(path)
+        except BaseException:
+            discard(path)
+            raise
+    try:
+        yield path
+    finally:
+        _release(clone_url, path)
+
+
+def _release(clone_url: str, path: str) -> None:
+    evicted = []
+    with _lock:
+        if clone_url in _idle or pool_size() == 0:
+            evicted.append(path)
+        else:
+            _idle[clone_url] = path
+        while len(_idle) > pool_size():
+            evicted.append(_idle.popitem(last=False)[1])
+    for p in evicted:
+        discard(p)
+
+
+@atexit.register
+def _clear() -> None:
+    with _lock:
+        paths = list(_idle.values())
+        _idle.clear()
+    for p in paths:
+        shutil.rmtree(p, ignore_errors=True)
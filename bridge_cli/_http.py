@@ -0,0 +1,47 @@
+"""Shared HTTP plumbing for GitHub API calls.
+
+One keep-alive session serves every analyzer, so repeated calls reuse warm
+TCP/TLS connections instead of handshaking each time. ``SESSION`` is None
+when ``requests`` is not installed; callers then skip network lookups.
+"""
+
+import hashlib
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except Exception:  # pragma: no cover - requests should exist, but fail gracefully
+    requests = None  # type: ignore
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore
+
+
+def _build_session():
+    session = requests.Session()
+    # Retry transient failures and rate-limit responses with backoff
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    session.headers.update({"Accept": "application/vnd.github+json", "User-Agent": "bridge-cli"})
+    return session
+
+
+SESSION = _build_session() if requests is not None else None
+
+
+def decode_json(resp) -> object:
+    """Parse a response body as JSON, with orjson when available."""
+    return orjson.loads(resp.content) if orjson is not None else resp.json()
+
+
+def cache_key(kind: str, *parts: str) -> str:
+    """Cache key from hashed parts, so tokens are never written to disk."""
+    return f"{kind}:" + hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
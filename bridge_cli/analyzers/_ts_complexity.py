@@ -0,0 +1,121 @@
+"""Optional tree-sitter backend for cyclomatic complexity.
+
+Parses in C and walks the concrete syntax tree instead of running radon's
+pure-Python AST visitor. Enabled with ``BRIDGE_USE_TREESITTER=1`` when
+``tree_sitter_languages`` (or ``tree_sitter`` + ``tree_sitter_python``) is
+installed; callers fall back to radon otherwise.
+
+The counting rules follow radon's ``ComplexityVisitor`` so both backends
+report the same numbers: only functions outside classes and other functions
+are reported, decorators and default arguments are not counted, and nested
+functions and classes do not add to the enclosing function.
+"""
+
+import os
+import re
+from typing import Any, List, Optional, Tuple
+
+try:
+    from tree_sitter_languages import get_parser as _get_parser
+except Exception:  # pragma: no cover - optional dependency
+    _get_parser = None  # type: ignore
+
+try:
+    import tree_sitter
+    import tree_sitter_python
+except Exception:  # pragma: no cover - optional dependency
+    tree_sitter = None  # type: ignore
+    tree_sitter_python = None  # type: ignore
+
+_PARSER: Any = None
+
+_NESTED_SCOPES = {"function_definition", "class_definition"}
+_PLAIN_NAME = re.compile(rb"^[A-Za-z_]\w*$")
+
+
+def enabled() -> bool:
+    """True when the backend is requested and a Python grammar is importable."""
+    if os.getenv("BRIDGE_USE_TREESITTER") != "1":
+        return False
+    return _parser() is not None
+
+
+def _parser() -> Any:
+    global _PARSER
+    if _PARSER is None:
+        try:
+            if _get_parser is not None:
+                _PARSER = _get_parser("python")
+            elif tree_sitter is not None and tree_sitter_python is not None:
+                _PARSER = tree_sitter.Parser(tree_sitter.Language(tree_sitter_python.language()))
+        except Exception:
+            _PARSER = None
+    return _PARSER
+
+
+def _is_irrefutable(case: Any) -> bool:
+    """``case _`` or ``case name``, which radon does not count."""
+    for child in case.named_children:
+        if child.type == "case_pattern":
+            text = child.text
+            return not child.named_children or (
+                _PLAIN_NAME.match(text) is not None and text not in (b"None", b"True", b"False")
+            )
+    return False
+
+
+def _decisions(node: Any) -> int:
+    """Decision points under ``node``, stopping at nested functions and classes."""
+    total = 0
+    stack = list(node.named_children)
+    while stack:
+        n = stack.pop()
+        t = n.type
+        if t in _NESTED_SCOPES:
+            continue
+        if t == "assert_statement":
+            # radon counts the assert itself but not what it tests
+            total += 1
+            continue
+        if t in ("if_statement", "elif_clause", "conditional_expression",
+                 "boolean_operator", "for_in_clause"):
+            total += 1
+        elif t == "if_clause":
+            # Comprehension filters count; ``case ... if guard`` does not
+            total += n.parent.type != "case_clause"
+        elif t in ("for_statement", "while_statement"):
+            total += 1 + (n.child_by_field_name("alternative") is not None)
+        elif t == "try_statement":
+            total += sum(1 for c in n.named_children if c.type in ("except_clause", "else_clause"))
+        elif t == "match_statement":
+            cases = [c for c in n.child_by_field_name("body").named_children if c.type == "case_clause"]
+            total += max(0, len(cases) - any(_is_irrefutable(c) for c in cases))
+        stack.extend(n.named_children)
+    return total
+
+
+def function_complexities(source: str) -> Optional[List[Tuple[int, str, int]]]:
+    """Return [(complexity, name, lineno)] for ``source``'s functions.
+
+    Returns None when the source does not parse, matching radon, or when the
+    backend is unavailable.
+    """
+    parser = _parser()
+    if parser is None:
+        return None
+    tree = parser.parse(source.encode("utf-8"))
+    if tree.root_node.has_error:
+        return None
+
+    functions: List[Tuple[int, str, int]] = []
+    stack = [tree.root_node]
+    while stack:
+        n = stack.pop()
+        if n.type == "function_definition":
+            name = n.child_by_field_name("name").text.decode("utf-8")
+            functions.append((1 + _decisions(n.child_by_field_name("body")), name, n.start_point[0] + 1))
+            continue
+        if n.type == "class_definition":
+            continue
+        stack.extend(reversed(n.named_children))
+    return functions
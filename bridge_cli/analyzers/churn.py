@@ -1,14 +1,26 @@
 """Calculates code churn using Git history when available."""
 
 import datetime
+import subprocess
+import time
 from collections import Counter, defaultdict
-from typing import Dict, List
+from typing import IO, Dict, Iterator
 from git import Repo
 from git.exc import InvalidGitRepositoryError, NoSuchPathError
 
-def _monday(dt: datetime.datetime) -> datetime.date:
-    d = dt.date()
-    return d - datetime.timedelta(days=d.weekday())
+_WEEK_SECONDS = 7 * 86400
+# 1970-01-01 was a Thursday; shifting by three days anchors weeks on Monday.
+_MONDAY_SHIFT = 3 * 86400
+
+
+def _nul_fields(stream: IO[str]) -> Iterator[str]:
+    """Yield NUL-separated fields from a text stream without reading it whole."""
+    pending = ""
+    for chunk in iter(lambda: stream.read(1 << 16), ""):
+        *complete, pending = (pending + chunk).split("\0")
+        yield from complete
+    if pending:
+        yield pending
 
 
 def analyze_churn(path: str, days: int = 30) -> dict:
@@ -23,7 +35,7 @@ def analyze_churn(path: str, days: int = 30) -> dict:
         dict: A dictionary containing churn metrics.
     """
     try:
-        repo = Repo(path)
+        Repo(path)
     except (InvalidGitRepositoryError, NoSuchPathError):
         # Not a git repo or path invalid: return zeros so other analyzers can still run
         return {
@@ -38,53 +50,66 @@ def analyze_churn(path: str, days: int = 30) -> dict:
 
     since_date = datetime.datetime.now() - datetime.timedelta(days=days)
 
-    # Use HEAD explicitly; since accepts ISO8601 string
-    commits = list(repo.iter_commits('HEAD', since=since_date.isoformat()))
-
-    total_commits = len(commits)
+    total_commits = 0
     changed_files = set()
     file_touches: Counter = Counter()
     dir_touches: Counter = Counter()
-    weekly: Dict[datetime.date, int] = defaultdict(int)
+    weekly: Dict[int, int] = defaultdict(int)
     authors: Counter = Counter()
+    dir_cache: Dict[str, str] = {}
 
-    for commit in commits:
-        # Author
-        try:
-            author_id = (commit.author.email or commit.author.name or 'unknown').lower()
-        except Exception:
-            author_id = 'unknown'
-        authors[author_id] += 1
-
-        # Weekly bucket
-        try:
-            c_dt = datetime.datetime.fromtimestamp(commit.committed_date)
-        except Exception:
-            c_dt = datetime.datetime.now()
-        weekly[_monday(c_dt)] += 1
+    # One `git log` for the whole window instead of a Commit object and a
+    # diff per commit. With -z every field is NUL-terminated, so paths need
+    # no unquoting: each commit is "\x01<ts>", "<email>", "<name>" followed
+    # by the paths it touched (the first prefixed with a newline). Merges are
+    # diffed against their first parent and the root commit against the
+    # empty tree, as before.
+    cmd = [
+        "git", "-C", path,
+        "log", "HEAD", f"--since={since_date.isoformat()}", "-z",
+        "--root", "--no-renames", "--diff-merges=first-parent", "--name-only",
+        "--pretty=format:%x01%ct%x00%ae%x00%an%x00",
+    ]
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ) as proc:
+        fields = _nul_fields(proc.stdout)
+        for field in fields:
+            if field.startswith("\x01"):
+                total_commits += 1
+                email = next(fields, "")
+                name = next(fields, "")
+                authors[(email or name or "unknown").lower()] += 1
+                try:
+                    c_ts = int(field[1:])
+                except ValueError:
+                    c_ts = int(time.time())
+                # Monday 00:00 UTC of the commit's week, as an epoch timestamp
+                weekly[c_ts - (c_ts + _MONDAY_SHIFT) % _WEEK_SECONDS] += 1
+                continue
+            if field.startswith("\n"):
+                field = field[1:]
+            if not field:
+                continue
+            changed_files.add(field)
+            file_touches[field] += 1
+            top = dir_cache.get(field)
+            if top is None:
+                top = dir_cache[field] = field.partition("/")[0]
+            dir_touches[top] += 1
 
-        # For the initial commit, which has no parents
-        if not commit.parents:
-            for item in commit.tree.traverse():
-                if getattr(item, 'type', None) == 'blob':
-                    path_str = item.path
-                    changed_files.add(path_str)
-                    file_touches[path_str] += 1
-                    top = path_str.split('/', 1)[0]
-                    dir_touches[top] += 1
-            continue
-
-        diffs = commit.parents[0].diff(commit, create_patch=False)
-        for diff in diffs:
-            for p in (diff.a_path, diff.b_path):
-                if not p:
-                    continue
-                changed_files.add(p)
-                file_touches[p] += 1
-                top = p.split('/', 1)[0]
-                dir_touches[top] += 1
-
-    weekly_commits = [{"week_start": d.isoformat(), "commits": weekly[d]} for d in sorted(weekly.keys())]
+    weekly_commits = [
+        {
+            "week_start": datetime.datetime.fromtimestamp(w, datetime.timezone.utc).date().isoformat(),
+            "commits": weekly[w],
+        }
+        for w in sorted(weekly.keys())
+    ]
 
     return {
         "total_commits": total_commits,
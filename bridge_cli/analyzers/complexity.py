@@ -1,113 +1,179 @@
 """Calculates cyclomatic complexity and maintainability insights."""
 
+import ast
 import os
+import re
 import heapq
-from typing import Dict, List, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from radon.visitors import ComplexityVisitor
 from radon.metrics import mi_visit
 
-def _percentile(values: List[float], p: float) -> float:
-    if not values:
-        return 0.0
-    values = sorted(values)
-    k = (len(values) - 1) * p
-    f = int(k)
-    c = min(f + 1, len(values) - 1)
-    if f == c:
-        return float(values[int(k)])
-    d0 = values[f] * (c - k)
-    d1 = values[c] * (k - f)
-    return float(d0 + d1)
+from bridge_cli.analyzers import _ts_complexity
+from bridge_cli.utils import MIN_FILES_FOR_POOL, iter_python_files, read_source
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is an optional speedup
+    np = None  # type: ignore
 
-def calculate_complexity(path: str) -> dict:
-    """
-    Calculates the average cyclomatic complexity and finds the most complex functions.
+# (file_path, [(complexity, name, lineno)], file_total, file_count, mi_or_None)
+FileResult = Tuple[str, List[Tuple[float, str, int]], float, int, Optional[float]]
 
-    Args:
-        path (str): The path to the directory to analyze.
+# Every construct radon counts as a decision point starts with one of these
+# keywords. Source without any of them has complexity 1 in every function.
+_BRANCHY = re.compile(r"\b(?:if|elif|for|while|try|except|and|or|case|assert)\b")
 
-    Returns:
-        dict: A dictionary containing the average complexity and a list of the
-              top 5 most complex functions.
+def _percentiles(values: Sequence[float], ps: Sequence[float]) -> List[float]:
+    """Linearly interpolated percentiles of ``values`` for each fraction in ``ps``."""
+    if not values:
+        return [0.0] * len(ps)
+    if np is not None:
+        # One partition pass for every requested percentile, on a
+        # zero-copy view of the buffer.
+        return [float(v) for v in np.percentile(np.frombuffer(values, dtype=np.float64), [p * 100 for p in ps])]
+    values = sorted(values)
+    out = []
+    for p in ps:
+        k = (len(values) - 1) * p
+        f = int(k)
+        c = min(f + 1, len(values) - 1)
+        if f == c:
+            out.append(float(values[f]))
+        else:
+            out.append(float(values[f] * (c - k) + values[c] * (k - f)))
+    return out
+
+
+def _straight_line_functions(content: str) -> Optional[List[Tuple[float, str, int]]]:
+    """Functions radon would report for branch-free source, each at complexity 1.
+
+    Mirrors ComplexityVisitor's traversal (functions outside classes and other
+    functions) without running its per-node Python visitor.
+    """
+    try:
+        tree = ast.parse(content)
+    except Exception:
+        return None
+    functions: List[Tuple[float, str, int]] = []
+    stack: List[ast.AST] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append((1, node.name, node.lineno))
+        elif not isinstance(node, ast.ClassDef):
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    return functions
+
+
+def analyze_source(file_path: str, content: str, with_mi: bool = True) -> Optional[FileResult]:
+    """Collect function complexities and MI for already-read source text.
+
+    Returns None when the source cannot be parsed. Function complexities come
+    from the tree-sitter backend when ``BRIDGE_USE_TREESITTER=1``, else radon.
     """
+    if not _BRANCHY.search(content):
+        functions = _straight_line_functions(content)
+        if functions is None:
+            return None
+    elif _ts_complexity.enabled():
+        functions = _ts_complexity.function_complexities(content)
+        if functions is None:
+            return None
+    else:
+        try:
+            visitor = ComplexityVisitor.from_code(content)
+        except Exception:
+            return None
+        functions = [(func.complexity, func.name, func.lineno) for func in visitor.functions]
+
+    # Maintainability Index per file
+    mi_val: Optional[float] = None
+    if with_mi:
+        try:
+            mi_val = float(mi_visit(content, False))
+        except Exception:
+            pass
+
+    file_total = float(sum(c for c, _, _ in functions))
+    return file_path, functions, file_total, len(functions), mi_val
+
+
+def _analyze_one(file_path: str, with_mi: bool = True) -> Optional[FileResult]:
+    """Read and analyze a single file.
+
+    Kept at module level so it can be pickled into worker processes. Returns
+    None when the file cannot be read or parsed.
+    """
+    try:
+        content = read_source(file_path)
+    except Exception:
+        return None
+    return analyze_source(file_path, content, with_mi)
+
+
+def summarize(results: Iterable[Optional[FileResult]]) -> dict:
+    """Aggregate per-file results, in path order, into the complexity report."""
     total_complexity: float = 0.0
     function_count = 0
     top_functions: List[Tuple[float, str]] = []
-    complexities: List[float] = []
+    complexities = array("d")
 
     file_stats: Dict[str, Dict[str, float]] = {}
     mi_per_file: Dict[str, float] = {}
 
-    for root, _, files in os.walk(path):
-        for file in files:
-            if not file.endswith(".py"):
-                continue
-            file_path = os.path.join(root, file)
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-            except Exception:
-                continue
-
-            try:
-                visitor = ComplexityVisitor.from_code(content)
-            except Exception:
-                continue
-
-            # Maintainability Index per file
-            try:
-                mi_val = float(mi_visit(content, False))
-                mi_per_file[file_path] = mi_val
-            except Exception:
-                pass
-
-            file_total = 0.0
-            file_count = 0
-
-            for func in visitor.functions:
-                total_complexity += func.complexity
-                function_count += 1
-                file_total += func.complexity
-                file_count += 1
-                complexities.append(func.complexity)
-
-                loc = f"{file_path}:{func.lineno} - {func.name}"
-                if len(top_functions) < 5:
-                    heapq.heappush(top_functions, (func.complexity, loc))
-                else:
-                    heapq.heappushpop(top_functions, (func.complexity, loc))
-
-            if file_count:
-                s = file_stats.setdefault(file_path, {"total": 0.0, "count": 0.0})
-                s["total"] += file_total
-                s["count"] += file_count
+    for res in results:
+        if res is None:
+            continue
+        file_path, functions, file_total, file_count, mi_val = res
+
+        if mi_val is not None:
+            mi_per_file[file_path] = mi_val
+
+        for complexity, name, lineno in functions:
+            total_complexity += complexity
+            function_count += 1
+            complexities.append(complexity)
+
+            loc = f"{file_path}:{lineno} - {name}"
+            if len(top_functions) < 5:
+                heapq.heappush(top_functions, (complexity, loc))
+            else:
+                heapq.heappushpop(top_functions, (complexity, loc))
+
+        if file_count:
+            s = file_stats.setdefault(file_path, {"total": 0.0, "count": 0.0})
+            s["total"] += file_total
+            s["count"] += file_count
 
     average_complexity = total_complexity / function_count if function_count > 0 else 0.0
-    p90 = _percentile(complexities, 0.90)
-
-    worst_files = sorted(
-        (
-            {
-                "file": fp,
-                "total_complexity": round(stats["total"], 2),
-                "avg_complexity": round(stats["total"] / stats["count"], 2) if stats["count"] else 0.0,
-            }
-            for fp, stats in file_stats.items()
-        ),
-        key=lambda x: (x["total_complexity"], x["avg_complexity"]),
-        reverse=True,
-    )[:5]
-
-    mi_items = [{"file": fp, "mi": round(mi, 1)} for fp, mi in mi_per_file.items()]
-    worst_mi = sorted(mi_items, key=lambda x: x["mi"])[:5]
-    avg_mi = round(sum(mi for _, mi in mi_per_file.items()) / len(mi_per_file), 1) if mi_per_file else 0.0
+    p50, p90 = _percentiles(complexities, (0.50, 0.90))
+
+    # Only the top 5 are reported, so select them without sorting every file.
+    worst_files = [
+        {
+            "file": fp,
+            "total_complexity": round(stats["total"], 2),
+            "avg_complexity": round(stats["total"] / stats["count"], 2) if stats["count"] else 0.0,
+        }
+        for fp, stats in heapq.nlargest(
+            5,
+            file_stats.items(),
+            key=lambda kv: (kv[1]["total"], kv[1]["total"] / kv[1]["count"] if kv[1]["count"] else 0.0),
+        )
+    ]
+
+    worst_mi = [{"file": fp, "mi": round(mi, 1)} for fp, mi in heapq.nsmallest(5, mi_per_file.items(), key=lambda kv: kv[1])]
+    avg_mi = round(sum(mi_per_file.values()) / len(mi_per_file), 1) if mi_per_file else 0.0
 
     sorted_top_functions = sorted(top_functions, key=lambda x: x[0], reverse=True)
 
     return {
         "average_complexity": round(average_complexity, 2),
         "function_count": function_count,
+        "p50_complexity": round(p50, 2),
         "p90_complexity": round(p90, 2),
         "top_complex_functions": [
             {"complexity": score, "location": location} for score, location in sorted_top_functions
@@ -117,4 +183,29 @@ def calculate_complexity(path: str) -> dict:
             "average_mi": avg_mi,
             "worst_files_by_mi": worst_mi,
         },
-    }
\ No newline at end of file
+    }
+
+
+def calculate_complexity(path: str, workers: Optional[int] = None, maintainability: bool = True) -> dict:
+    """
+    Calculates the average cyclomatic complexity and finds the most complex functions.
+
+    Args:
+        path (str): The path to the directory to analyze.
+        workers (Optional[int]): Number of worker processes used to parse files.
+            Defaults to the number of CPUs; 1 analyzes files in-process.
+        maintainability (bool): Also compute the Maintainability Index. This
+            re-analyzes every file and dominates the run time, so callers
+            that do not report MI should turn it off.
+
+    Returns:
+        dict: A dictionary containing the average complexity and a list of the
+              top 5 most complex functions.
+    """
+    paths = sorted(iter_python_files(path))
+
+    analyze_one = partial(_analyze_one, with_mi=maintainability)
+    if workers == 1 or len(paths) < MIN_FILES_FOR_POOL:
+        return summarize(map(analyze_one, paths))
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as ex:
+        return summarize(list(ex.map(analyze_one, paths, chunksize=16)))
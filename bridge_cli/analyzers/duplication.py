@@ -1,61 +1,174 @@
-"""Analyzes code duplication using jscpd."""
+"""Detects duplicated code with an in-process rolling-hash (Rabin-Karp) scan."""
 
-import subprocess
-import json
+import io
 import os
-import tempfile
+import tokenize
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-def analyze_duplication(path: str) -> dict:
+from bridge_cli.utils import MIN_FILES_FOR_POOL, iter_python_files, read_source
+
+# Same thresholds as jscpd's defaults: a clone spans at least 50 tokens and 5 lines.
+_MIN_TOKENS = 50
+_MIN_LINES = 5
+
+_BASE = 257
+_MOD = (1 << 61) - 1
+
+_SKIP_TOKENS = {
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.NEWLINE,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENCODING,
+    tokenize.ENDMARKER,
+}
+
+
+def _tokenize(source: str) -> Tuple[List[int], List[int]]:
+    """Return (token ids, start lines) for significant tokens in ``source``.
+
+    Whitespace and comments are dropped. Token ids are CRC32s of the token
+    text so they are stable across processes.
+    """
+    ids: List[int] = []
+    lines: List[int] = []
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type in _SKIP_TOKENS:
+                continue
+            ids.append(zlib.crc32(tok.string.encode("utf-8")))
+            lines.append(tok.start[0])
+    except (tokenize.TokenError, SyntaxError):
+        # Keep what was tokenized before the error
+        pass
+    return ids, lines
+
+
+def _window_hashes(ids: List[int]) -> List[int]:
+    """Polynomial rolling hash of every _MIN_TOKENS-long window of ``ids``."""
+    if len(ids) < _MIN_TOKENS:
+        return []
+    top = pow(_BASE, _MIN_TOKENS - 1, _MOD)
+    h = 0
+    for t in ids[:_MIN_TOKENS]:
+        h = (h * _BASE + t) % _MOD
+    hashes = [h]
+    for i in range(_MIN_TOKENS, len(ids)):
+        h = ((h - ids[i - _MIN_TOKENS] * top) * _BASE + ids[i]) % _MOD
+        hashes.append(h)
+    return hashes
+
+
+# (line count, token ids, token start lines, window hashes)
+Prepared = Tuple[int, List[int], List[int], List[int]]
+
+
+def _prepare(file_path: str) -> Optional[Prepared]:
+    """Read, tokenize and hash one file; None if it cannot be read.
+
+    Kept at module level so it can be pickled into worker processes. This
+    is the bulk of the work; matching windows across files stays in the
+    parent because it depends on file order.
     """
-    Analyzes code duplication using jscpd and provides a detailed report.
+    try:
+        source = read_source(file_path)
+    except OSError:
+        return None
+    ids, lines = _tokenize(source)
+    return len(source.splitlines()), ids, lines, _window_hashes(ids)
+
+
+def analyze_duplication(path: str, workers: Optional[int] = None) -> dict:
+    """
+    Analyzes code duplication across Python sources and provides a detailed report.
 
     Args:
         path (str): The path to the directory to analyze.
+        workers (Optional[int]): Number of worker processes used to tokenize
+            files. Defaults to the number of CPUs; 1 works in-process.
 
     Returns:
-        dict: A dictionary with the duplication percentage and a list of duplicates.
+        dict: A dictionary with the duplication percentage (duplicated lines
+              over total lines) and a list of duplicates.
     """
-    report_path = os.path.join(tempfile.gettempdir(), "jscpd-report.json")
-    command = [
-        "jscpd",
-        path,
-        "--silent",
-        "--reporters",
-        "json",
-        "--output",
-        tempfile.gettempdir(),
-        "--reporters-json-name",
-        "jscpd-report.json"
-    ]
+    paths = sorted(iter_python_files(path))
+    n = workers or os.cpu_count() or 1
+    if n == 1 or len(paths) < MIN_FILES_FOR_POOL:
+        return _find_duplicates(paths, map(_prepare, paths))
+    with ProcessPoolExecutor(max_workers=n) as ex:
+        return _find_duplicates(paths, ex.map(_prepare, paths, chunksize=16))
+
 
+def _find_duplicates(paths: List[str], prepared: Iterable[Optional[Prepared]]) -> dict:
     report = {
         "duplication_percentage": 0.0,
         "duplicated_fragments": []
     }
 
-    try:
-        subprocess.run(command, check=True, capture_output=True, text=True)
-        with open(report_path, "r") as f:
-            jscpd_report = json.load(f)
-        
-        report["duplication_percentage"] = jscpd_report.get("statistics", {}).get("total", {}).get("percentage", 0.0)
-
-        for dup in jscpd_report.get("duplicates", []):
-            report["duplicated_fragments"].append({
-                "fragment": dup.get("fragment"),
-                "first_file": f"{dup['firstFile']['name']}:{dup['firstFile']['startLoc']['line']}",
-                "second_file": f"{dup['secondFile']['name']}:{dup['secondFile']['startLoc']['line']}",
-            })
-        
-        return report
-
-    except FileNotFoundError:
-        print("Warning: jscpd not found. Skipping duplication analysis.")
-        print("Please install jscpd: npm install -g jscpd")
-        return report
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-        print(f"Error running jscpd: {e}")
-        return report
-    finally:
-        if os.path.exists(report_path):
-            os.remove(report_path) 
\ No newline at end of file
+    names: List[str] = []
+    all_ids: List[List[int]] = []
+    all_lines: List[List[int]] = []
+    seen: Dict[int, Tuple[int, int]] = {}
+    total_lines = 0
+    duplicated_lines = 0
+
+    for file_path, prep in zip(paths, prepared):
+        if prep is None:
+            continue
+        n_lines, ids, lines, hashes = prep
+        total_lines += n_lines
+        # Fragment text is only needed on a match; re-read lazily
+        src_lines: Optional[List[str]] = None
+
+        f = len(names)
+        names.append(file_path)
+        all_ids.append(ids)
+        all_lines.append(lines)
+
+        dup_lines: Set[int] = set()
+        i = 0
+        while i < len(hashes):
+            h = hashes[i]
+            hit = seen.get(h)
+            if hit is not None:
+                fa, ia = hit
+                a_ids = all_ids[fa]
+                # Verify the hash match and refuse overlaps within one file
+                if a_ids[ia:ia + _MIN_TOKENS] == ids[i:i + _MIN_TOKENS] and not (fa == f and ia + _MIN_TOKENS > i):
+                    k = _MIN_TOKENS
+                    while (
+                        i + k < len(ids)
+                        and ia + k < len(a_ids)
+                        and a_ids[ia + k] == ids[i + k]
+                        and not (fa == f and ia + k >= i)
+                    ):
+                        k += 1
+                    for t in range(i, min(i + k, len(hashes))):
+                        seen.setdefault(hashes[t], (f, t))
+
+                    start, end = lines[i], lines[i + k - 1]
+                    if end - start + 1 >= _MIN_LINES:
+                        if src_lines is None:
+                            try:
+                                src_lines = read_source(file_path).splitlines()
+                            except OSError:
+                                src_lines = []
+                        a_start = all_lines[fa][ia]
+                        dup_lines.update(range(start, end + 1))
+                        report["duplicated_fragments"].append({
+                            "fragment": "\n".join(src_lines[start - 1:end]),
+                            "first_file": f"{names[fa]}:{a_start}",
+                            "second_file": f"{file_path}:{start}",
+                        })
+                    i += k
+                    continue
+            seen.setdefault(h, (f, i))
+            i += 1
+        duplicated_lines += len(dup_lines)
+
+    if total_lines:
+        report["duplication_percentage"] = round(duplicated_lines / total_lines * 100, 2)
+    return report
@@ -0,0 +1,90 @@
+"""Repository overview from GitHub's GraphQL API in a single request.
+
+One query returns what would otherwise take separate REST calls for the
+open issue count and the language breakdown.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from bridge_cli import _http
+from bridge_cli import cache as result_cache
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_OVERVIEW_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+  }
+}
+"""
+
+# Same freshness as the REST repo lookup it replaces; issue counts move quickly.
+_OVERVIEW_TTL = 10 * 60
+
+# Per cache key [lock, holders], so concurrent callers for the same repository
+# share one request while other repositories proceed; _LOCKS_GUARD only
+# protects the dict and is never held across a request.
+_LOCKS: Dict[str, List[Any]] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def _key_lock(key: str) -> Iterator[None]:
+    with _LOCKS_GUARD:
+        entry = _LOCKS.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _LOCKS_GUARD:
+            entry[1] -= 1
+            if not entry[1]:
+                del _LOCKS[key]
+
+
+def fetch_overview(full_name: str, token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Open issue count and language bytes for ``full_name`` ("owner/repo").
+
+    Returns {"open_issues": int, "languages": {name: bytes}}, or None when
+    there is no token (GraphQL requires auth) or the query fails; callers
+    then fall back to the REST endpoints. Results are cached for
+    _OVERVIEW_TTL.
+    """
+    if _http.SESSION is None or not token:
+        return None
+    key = _http.cache_key("github-graphql", full_name, token)
+    cached = result_cache.get(key, max_age=_OVERVIEW_TTL)
+    if cached is not None:
+        return cached
+    with _key_lock(key):
+        # A caller that held the lock before us may have just fetched it
+        cached = result_cache.get(key, max_age=_OVERVIEW_TTL)
+        if cached is not None:
+            return cached
+        owner, name = full_name.split("/", 1)
+        try:
+            resp = _http.SESSION.post(
+                _GRAPHQL_URL,
+                json={"query": _OVERVIEW_QUERY, "variables": {"owner": owner, "name": name}},
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=10,
+            )
+            if resp.status_code != 200:
+                return None
+            repo = (_http.decode_json(resp).get("data") or {}).get("repository")
+            if not repo:
+                return None
+            result = {
+                # Match REST's open_issues_count, which includes pull requests
+                "open_issues": int(repo["issues"]["totalCount"]) + int(repo["pullRequests"]["totalCount"]),
+                "languages": {e["node"]["name"]: int(e["size"]) for e in repo["languages"]["edges"]},
+            }
+        except Exception:
+            return None
+        result_cache.put(key, result)
+        return result
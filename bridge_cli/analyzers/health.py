@@ -1,7 +1,9 @@
 """Repository health KPIs: contributors, bus factor, release cadence."""
 
+import re
+import subprocess
 import time
-from typing import Dict
+from typing import Dict, List
 
 try:
     from git import Repo
@@ -11,6 +13,9 @@ except Exception:  # pragma: no cover
     InvalidGitRepositoryError = Exception  # type: ignore
     NoSuchPathError = Exception  # type: ignore
 
+# "   12\tJane Doe <jane@example.com>" from `git shortlog -sne`
+_SHORTLOG_RE = re.compile(r"^\s*(\d+)\t(.*?)\s*<([^>]*)>\s*$")
+
 
 def _bus_factor_from_author_counts(author_counts: Dict[str, int]) -> int:
     total = sum(author_counts.values())
@@ -26,6 +31,23 @@ def _bus_factor_from_author_counts(author_counts: Dict[str, int]) -> int:
     return factor
 
 
+def _git_lines(path: str, *args: str) -> List[str]:
+    """Output lines of a git command run in ``path``; empty on failure."""
+    try:
+        out = subprocess.run(
+            ["git", "-C", path, *args],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return out.splitlines()
+
+
 def analyze_health(path: str) -> dict:
     if Repo is None:
         return {
@@ -35,7 +57,7 @@ def analyze_health(path: str) -> dict:
             "release_cadence": {"avg_days_between_releases": 0.0, "releases_last_year": 0},
         }
     try:
-        repo = Repo(path)
+        Repo(path)
     except (InvalidGitRepositoryError, NoSuchPathError):
         return {
             "contributors": 0,
@@ -44,14 +66,15 @@ def analyze_health(path: str) -> dict:
             "release_cadence": {"avg_days_between_releases": 0.0, "releases_last_year": 0},
         }
 
-    # Authors/Contributors and bus factor
+    # Authors/Contributors and bus factor; git groups commits per author
     author_counts: Dict[str, int] = {}
-    for c in repo.iter_commits("HEAD"):
-        try:
-            key = (c.author.email or c.author.name or "unknown").lower()
-        except Exception:
-            key = "unknown"
-        author_counts[key] = author_counts.get(key, 0) + 1
+    for line in _git_lines(path, "shortlog", "-sne", "HEAD"):
+        m = _SHORTLOG_RE.match(line)
+        if not m:
+            continue
+        count, name, email = m.groups()
+        key = (email or name or "unknown").lower()
+        author_counts[key] = author_counts.get(key, 0) + int(count)
     contributors = len(author_counts)
     bus_factor = _bus_factor_from_author_counts(author_counts)
     top_authors = [
@@ -59,13 +82,12 @@ def analyze_health(path: str) -> dict:
         for a, n in sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[:5]
     ]
 
-    # Release cadence via tags
+    # Release cadence via tags: commit date of each tag's target. Annotated
+    # tags only fill the peeled (*) field, lightweight tags the plain one.
     tag_dates = []
-    for t in getattr(repo, "tags", []):
-        try:
-            tag_dates.append(int(t.commit.committed_date))
-        except Exception:
-            continue
+    for line in _git_lines(path, "for-each-ref", "--format=%(*committerdate:unix)%(committerdate:unix)", "refs/tags"):
+        if line.strip().isdigit():
+            tag_dates.append(int(line))
     tag_dates = sorted(tag_dates)
     avg_days = 0.0
     if len(tag_dates) >= 2:
@@ -4,9 +4,18 @@ All functions are resilient to missing Git or network. They return sensible
 defaults so the CLI can always render a summary.
 """
 
+import itertools
 import os
+import re
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bridge_cli import _http
+from bridge_cli import cache as result_cache
+from bridge_cli.analyzers.github_graphql import fetch_overview
+from bridge_cli.utils import IGNORE_DIRS
 
 # Defer optional imports for resilience
 try:
@@ -17,10 +26,13 @@ except Exception:  # pragma: no cover - environment without GitPython
     InvalidGitRepositoryError = Exception  # type: ignore
     NoSuchPathError = Exception  # type: ignore
 
-try:
-    import requests
-except Exception:  # pragma: no cover - requests should exist, but fail gracefully
-    requests = None  # type: ignore
+
+# owner/repo from a GitHub URL (https, git, ssh or scp-style "git@github.com:")
+# with an optional .git suffix and trailing path, or from "owner/repo" shorthand.
+_GITHUB_NAME_RE = re.compile(
+    r"^(?:.*?github\.com[:/]+(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+?)(?:\.git)?(?:[/?#].*)?"
+    r"|(?P<s_owner>[\w.-]+)/(?P<s_repo>[\w.-]+?)(?:\.git)?)$"
+)
 
 
 def parse_github_full_name(repo_ref: str) -> Optional[str]:
@@ -28,23 +40,12 @@ def parse_github_full_name(repo_ref: str) -> Optional[str]:
 
     Returns None if it cannot be parsed.
     """
-    if "github.com" in repo_ref:
-        parts = repo_ref.rstrip("/")
-        if parts.endswith(".git"):
-            parts = parts[:-4]
-        try:
-            owner, repo = parts.split("github.com/")[-1].split("/")[:2]
-            return f"{owner}/{repo}"
-        except ValueError:
-            return None
-    # Shorthand owner/repo
-    if repo_ref.count("/") == 1 and "://" not in repo_ref:
-        owner, repo = repo_ref.split("/")
-        if owner and repo and not repo.endswith(".git"):
-            return f"{owner}/{repo}"
-        if owner and repo.endswith(".git"):
-            return f"{owner}/{repo[:-4]}"
-    return None
+    m = _GITHUB_NAME_RE.match(repo_ref)
+    if not m:
+        return None
+    if m.group("owner"):
+        return f"{m.group('owner')}/{m.group('repo')}"
+    return f"{m.group('s_owner')}/{m.group('s_repo')}"
 
 
 def get_repo_name(repo_ref: str) -> str:
@@ -69,13 +70,14 @@ def get_age_days_and_total_commits(path: str) -> Tuple[Optional[int], int]:
         return None, 0
     try:
         repo = Repo(path)
-        commits = list(repo.iter_commits("HEAD"))
-        if not commits:
+        total_commits = int(repo.git.rev_list("--count", "HEAD"))
+        if not total_commits:
             return 0, 0
-        first = commits[-1].committed_date
+        # Root commits only (history can have several); the oldest dates the repo
+        first = min(int(ts) for ts in repo.git.log("--max-parents=0", "--format=%ct", "HEAD").split())
         now = int(time.time())
-        age_days = max(0, int((now - first) / 86400))
-        return age_days, len(commits)
+        age_days = max(0, (now - first) // 86400)
+        return age_days, total_commits
     except (InvalidGitRepositoryError, NoSuchPathError, Exception):
         return None, 0
 
@@ -106,72 +108,247 @@ _EXT_TO_LANG: Dict[str, str] = {
     ".yml": "YAML",
     ".yaml": "YAML",
 }
+_EXTS = tuple(_EXT_TO_LANG)
 
-_IGNORE_DIRS = {".git", "node_modules", ".venv", "venv", "dist", "build", "__pycache__"}
 
+# Line counting skips files larger than this and files whose first
+# _SNIFF_BYTES contain a NUL byte. Their bytes still count toward languages.
+_MAX_FILE_BYTES = 2 * 1024 * 1024
+_SNIFF_BYTES = 4096
 
-def _local_language_bytes(path: str) -> Dict[str, int]:
-    totals: Dict[str, int] = {}
-    for root, dirs, files in os.walk(path):
-        # Prune ignored directories
-        dirs[:] = [d for d in dirs if d not in _IGNORE_DIRS]
-        for fname in files:
-            ext = os.path.splitext(fname)[1].lower()
-            lang = _EXT_TO_LANG.get(ext)
-            if not lang:
+
+def _count_lines(fp: str) -> int:
+    """Count physical lines in ``fp`` the way text-mode iteration would.
+
+    Works on raw bytes in 1 MiB chunks so no per-line objects are created.
+    "\n", "\r\n" and a lone "\r" each end a line, and a final line without
+    a terminator still counts. Files with a NUL byte near the start are
+    treated as binary and count as 0.
+    """
+    lines = 0
+    last = b""
+    with open(fp, "rb") as f:
+        head = f.read(_SNIFF_BYTES)
+        if b"\0" in head:
+            return 0
+        for buf in itertools.chain((head,), iter(lambda: f.read(1 << 20), b"")):
+            lines += buf.count(b"\n")
+            if b"\r" in buf:
+                lines += buf.count(b"\r") - buf.count(b"\r\n")
+            if last == b"\r" and buf[:1] == b"\n":
+                # A CRLF split across chunks was counted twice
+                lines -= 1
+            last = buf[-1:]
+    return lines + (last not in (b"", b"\n", b"\r"))
+
+
+def _scan_files(entries: Iterable[os.DirEntry], totals: Counter, stack: List[str]) -> int:
+    """Tally recognized files in ``entries`` into ``totals``; queue subdirectories.
+
+    Returns the number of lines in those files.
+    """
+    lines = 0
+    for entry in entries:
+        # Ignored names never carry a source extension, so skip them outright
+        if entry.name in IGNORE_DIRS:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            stack.append(entry.path)
+            continue
+        name = entry.name.lower()
+        # C-level suffix test first; only matches pay for the dict lookup
+        if not name.endswith(_EXTS):
+            continue
+        dot = name.rfind(".")
+        lang = _EXT_TO_LANG.get(name[dot:]) if dot > 0 else None
+        if not lang:
+            continue
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            continue
+        totals[lang] += size
+        if not size or size > _MAX_FILE_BYTES:
+            # Empty files have no lines; oversized ones are almost certainly
+            # generated (dumps, bundles) and not worth reading
+            continue
+        try:
+            lines += _count_lines(entry.path)
+        except OSError:
+            continue
+    return lines
+
+
+def _scan_subtree(root: str) -> Tuple[Counter, int]:
+    """Walk ``root`` depth-first; return (bytes per language, total lines)."""
+    totals: Counter = Counter()
+    lines = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        lines += _scan_files(entries, totals, stack)
+    return totals, lines
+
+
+def _scan_workers() -> int:
+    """Thread count for the repo scan; ``BRIDGE_SCAN_WORKERS`` overrides it."""
+    try:
+        return max(1, int(os.environ["BRIDGE_SCAN_WORKERS"]))
+    except (KeyError, ValueError):
+        return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _lang_probe() -> int:
+    """Files the source probe may see; ``BRIDGE_LANG_PROBE`` overrides, 0 disables."""
+    try:
+        return max(0, int(os.environ["BRIDGE_LANG_PROBE"]))
+    except (KeyError, ValueError):
+        return 512
+
+
+def _probe_for_sources(path: str, limit: int) -> bool:
+    """Look for a recognized source file among the first ``limit`` files.
+
+    Walks breadth-first on names alone (no stat, no reads), so asset-only
+    trees are rejected after a bounded amount of directory listing.
+    """
+    seen = 0
+    queue = deque([path])
+    while queue:
+        try:
+            with os.scandir(queue.popleft()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name in IGNORE_DIRS:
                 continue
-            fp = os.path.join(root, fname)
-            try:
-                size = os.path.getsize(fp)
-            except OSError:
+            if entry.is_dir(follow_symlinks=False):
+                queue.append(entry.path)
                 continue
-            totals[lang] = totals.get(lang, 0) + size
-    return totals
+            if entry.name.lower().endswith(_EXTS):
+                return True
+            seen += 1
+            if seen >= limit:
+                return False
+    return False
+
+
+def scan_repo(path: str) -> Tuple[Dict[str, int], int]:
+    """Walk ``path`` once; return (bytes per language, total lines).
+
+    Pass the result to language_breakdown() and total_lines_of_code() as
+    ``scan`` so both read one traversal. Nothing is memoized between calls.
+    Top-level subdirectories are scanned on a thread pool: the work is stat
+    and read calls, which release the GIL.
+    """
+    totals: Counter = Counter()
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            lines = _scan_files(list(it), totals, subdirs)
+    except OSError:
+        return {}, 0
+
+    workers = min(_scan_workers(), len(subdirs))
+    if workers <= 1:
+        results = map(_scan_subtree, subdirs)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_scan_subtree, subdirs))
+    for sub_totals, sub_lines in results:
+        totals.update(sub_totals)
+        lines += sub_lines
+    return dict(totals), lines
+
+
+def _local_language_bytes(path: str) -> Dict[str, int]:
+    """Bytes per language from a local walk.
+
+    A bounded probe runs first so asset-only trees are rejected without a
+    full walk.
+    """
+    probe = _lang_probe()
+    if probe and not _probe_for_sources(path, probe):
+        return {}
+    return scan_repo(path)[0]
 
 
-def total_lines_of_code(path: str) -> int:
+def total_lines_of_code(path: str, scan: Optional[Tuple[Dict[str, int], int]] = None) -> int:
     """Count total lines across source files recognized by _EXT_TO_LANG.
 
     This counts physical lines; it does not attempt to filter comments/blank lines.
+    ``scan`` reuses a scan_repo() result instead of walking ``path`` again.
     """
-    total = 0
-    for root, dirs, files in os.walk(path):
-        dirs[:] = [d for d in dirs if d not in _IGNORE_DIRS]
-        for fname in files:
-            ext = os.path.splitext(fname)[1].lower()
-            if ext not in _EXT_TO_LANG:
-                continue
-            fp = os.path.join(root, fname)
-            try:
-                with open(fp, "r", encoding="utf-8", errors="ignore") as f:
-                    for _ in f:
-                        total += 1
-            except OSError:
-                continue
-    return total
+    return (scan if scan is not None else scan_repo(path))[1]
+
+
+# How long a cached GitHub response is used without revalidating it. Open
+# issue counts move quickly; language byte totals barely move.
+_REPO_TTL = 10 * 60
+_LANGUAGES_TTL = 24 * 3600
+
+
+def _github_get_json(url: str, token: Optional[str], ttl: float) -> Optional[object]:
+    """GET a GitHub API URL, reusing a cached body via its ETag.
+
+    A response younger than ``ttl`` is returned without a request. Older
+    ones are revalidated with If-None-Match; a 304 reuses the cached body
+    and does not count against GitHub's rate limit. Cache entries are keyed
+    by a hash of the URL and token, so the token itself is never stored.
+    """
+    key = _http.cache_key("github", url, token or "")
+    cached = result_cache.get(key, max_age=ttl)
+    if cached is not None:
+        return cached["json"]
+
+    stale = result_cache.get(key, max_age=None)
+    headers = {}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    if stale is not None and stale.get("etag"):
+        headers["If-None-Match"] = stale["etag"]
+
+    resp = _http.SESSION.get(url, headers=headers, timeout=10)
+    if resp.status_code == 304 and stale is not None:
+        result_cache.put(key, stale)
+        return stale["json"]
+    if resp.status_code == 200:
+        data = _http.decode_json(resp)
+        result_cache.put(key, {"etag": resp.headers.get("ETag"), "json": data})
+        return data
+    return None
 
 
 def _github_language_bytes(full_name: str, token: Optional[str]) -> Optional[Dict[str, int]]:
-    if requests is None:
+    if _http.SESSION is None:
         return None
+    overview = fetch_overview(full_name, token)
+    if overview is not None:
+        return overview["languages"]
     try:
         url = f"https://api.github.com/repos/{full_name}/languages"
-        headers = {"Accept": "application/vnd.github+json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if isinstance(data, dict):
-                # Convert keys to our language labels where possible
-                return {k: int(v) for k, v in data.items()}
+        data = _github_get_json(url, token, _LANGUAGES_TTL)
+        if isinstance(data, dict):
+            # Convert keys to our language labels where possible
+            return {k: int(v) for k, v in data.items()}
     except Exception:
         return None
     return None
 
 
-def language_breakdown(path: str, repo_ref: str) -> List[Tuple[str, float]]:
-    """Return a sorted list of (language, percent)."""
+def language_breakdown(
+    path: str, repo_ref: str, scan: Optional[Tuple[Dict[str, int], int]] = None
+) -> List[Tuple[str, float]]:
+    """Return a sorted list of (language, percent).
+
+    ``scan`` is a scan_repo() result for ``path``; when given, the local
+    fallback reads it instead of probing and walking the tree.
+    """
     # Prefer GitHub API if we can parse owner/repo
     gh_full = parse_github_full_name(repo_ref)
     token = os.getenv("GITHUB_TOKEN")
@@ -180,7 +357,7 @@ def language_breakdown(path: str, repo_ref: str) -> List[Tuple[str, float]]:
         totals = _github_language_bytes(gh_full, token)
 
     if not totals:
-        totals = _local_language_bytes(path)
+        totals = scan[0] if scan is not None else _local_language_bytes(path)
 
     total_bytes = sum(totals.values()) if totals else 0
     if total_bytes == 0:
@@ -195,22 +372,20 @@ def fetch_open_issues(repo_ref: str) -> Optional[int]:
 
     Note: GitHub's open_issues_count includes PRs; still useful as a signal.
     """
-    if requests is None:
+    if _http.SESSION is None:
         return None
     gh_full = parse_github_full_name(repo_ref)
     if not gh_full:
         return None
     token = os.getenv("GITHUB_TOKEN")
+    overview = fetch_overview(gh_full, token)
+    if overview is not None:
+        return overview["open_issues"]
     try:
         url = f"https://api.github.com/repos/{gh_full}"
-        headers = {"Accept": "application/vnd.github+json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if isinstance(data, dict) and "open_issues_count" in data:
-                return int(data["open_issues_count"])  # includes PRs
+        data = _github_get_json(url, token, _REPO_TTL)
+        if isinstance(data, dict) and "open_issues_count" in data:
+            return int(data["open_issues_count"])  # includes PRs
     except Exception:
         return None
     return None
@@ -1,48 +1,123 @@
 """Runs security analysis using Bandit."""
 
+import io
 import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
 from bandit.core import manager as bandit_manager
 from bandit.core import config as bandit_config
 from bandit.core import constants as bandit_constants
+from bandit.core import metrics as bandit_metrics
 
-def analyze_security(path: str) -> dict:
-    """
-    Analyzes a directory for security issues using Bandit.
+from bridge_cli.utils import MIN_FILES_FOR_POOL, iter_python_files
 
-    Args:
-        path (str): The path to the directory to analyze.
+# (file, line, description, severity)
+IssueRow = Tuple[str, int, str, str]
 
-    Returns:
-        dict: A dictionary with counts of issues and a detailed list of
-              high and medium severity issues.
+# Per-thread BanditManager. Building one loads every plugin, so it is made
+# once per thread (by _init_bandit() in pool workers, else on first use)
+# and reset between scans. Managers hold per-scan state, so threads running
+# scans concurrently (the web server's analyses) must not share one.
+_LOCAL = threading.local()
+
+
+def _init_bandit() -> None:
+    """Pool initializer: build this worker's BanditManager up front."""
+    _LOCAL.manager = bandit_manager.BanditManager(bandit_config.BanditConfig(), "file")
+
+
+def _manager():
+    """Return this thread's BanditManager with per-scan state cleared."""
+    if getattr(_LOCAL, "manager", None) is None:
+        _init_bandit()
+    b_manager = _LOCAL.manager
+    b_manager.files_list = []
+    b_manager.excluded_files = []
+    b_manager.skipped = []
+    b_manager.results = []
+    b_manager.scores = []
+    b_manager.metrics = bandit_metrics.Metrics()
+    return b_manager
+
+
+def _bandit_scan_chunk(files: List[str]) -> List[IssueRow]:
+    """Run Bandit over ``files`` and return one row per issue found.
+
+    Kept at module level so it can be pickled into worker processes.
     """
-    b_config = bandit_config.BanditConfig()
-    b_manager = bandit_manager.BanditManager(b_config, "file")
-    b_manager.discover_files([path], recursive=True)
+    b_manager = _manager()
+    b_manager.discover_files(files, recursive=False)
     b_manager.run_tests()
 
     results = b_manager.get_issue_list(sev_level=bandit_constants.LOW, conf_level=bandit_constants.LOW)
+    return [(issue.fname, issue.lineno, issue.text, str(issue.severity).lower()) for issue in results]
+
+
+def scan_source(fname: str, content: str) -> List[IssueRow]:
+    """Run Bandit over already-read source text and return its issue rows.
+
+    Feeds the text through BanditManager._parse_file, the same per-file
+    entry point run_tests() uses, so callers that already hold the source
+    do not make Bandit read it again.
+    """
+    b_manager = _manager()
+    b_manager._parse_file(fname, io.BytesIO(content.encode("utf-8")), [fname])
+
+    results = b_manager.get_issue_list(sev_level=bandit_constants.LOW, conf_level=bandit_constants.LOW)
+    return [(issue.fname, issue.lineno, issue.text, str(issue.severity).lower()) for issue in results]
 
-    report = {
+
+def summarize(rows: Iterable[IssueRow]) -> dict:
+    """Tally issue rows into the security report."""
+    rows = list(rows)
+    counts = Counter(severity_label for _, _, _, severity_label in rows)
+    return {
         "issues_by_severity": {
-            "high": 0,
-            "medium": 0,
-            "low": 0
+            "high": counts["high"],
+            "medium": counts["medium"],
+            "low": counts["low"]
         },
-        "detailed_issues": []
+        "detailed_issues": [
+            {
+                "file": fname,
+                "line": lineno,
+                "description": text,
+                "severity": severity_label
+            }
+            for fname, lineno, text, severity_label in rows
+            if severity_label in ("high", "medium")
+        ]
     }
 
-    for issue in results:
-        severity_label = str(issue.severity).lower()
-        if severity_label in report["issues_by_severity"]:
-            report["issues_by_severity"][severity_label] += 1
 
-        if issue.severity in [bandit_constants.HIGH, bandit_constants.MEDIUM]:
-            report["detailed_issues"].append({
-                "file": issue.fname,
-                "line": issue.lineno,
-                "description": issue.text,
-                "severity": severity_label
-            })
+def analyze_security(path: str, workers: Optional[int] = None) -> dict:
+    """
+    Analyzes a directory for security issues using Bandit.
+
+    Args:
+        path (str): The path to the directory to analyze.
+        workers (Optional[int]): Number of worker processes to shard files
+            across. Defaults to the number of CPUs; 1 runs Bandit in-process.
+
+    Returns:
+        dict: A dictionary with counts of issues and a detailed list of
+              high and medium severity issues.
+    """
+    python_files = sorted(iter_python_files(path))
+    if not python_files:
+        # Nothing for Bandit to do; skip loading its plugins at all
+        return summarize([])
+
+    n = workers or os.cpu_count() or 1
+    if n == 1 or len(python_files) < MIN_FILES_FOR_POOL:
+        rows = _bandit_scan_chunk(python_files)
+    else:
+        chunks = [python_files[i::n] for i in range(n)]
+        with ProcessPoolExecutor(max_workers=n, initializer=_init_bandit) as ex:
+            rows = [row for chunk_rows in ex.map(_bandit_scan_chunk, chunks) for row in chunk_rows]
+        # Restore Bandit's file order; a file's issues all come from one chunk.
+        rows.sort(key=lambda row: row[0])
 
-    return report 
\ No newline at end of file
+    return summarize(rows)
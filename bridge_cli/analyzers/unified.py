@@ -0,0 +1,84 @@
+"""Single-traversal scanner that feeds each Python file to several analyzers.
+
+Complexity and security both need every ``.py`` file's source. Running them
+separately walks the tree and reads every file twice; the scanner walks and
+reads once, hands the same text to each pass, then lets each pass summarize
+its own per-file results.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from bridge_cli.analyzers import complexity, security
+from bridge_cli.utils import MIN_FILES_FOR_POOL, iter_python_files, read_source
+
+
+class ComplexityPass:
+    """Cyclomatic complexity (and optionally MI) via radon."""
+
+    name = "complexity"
+
+    def __init__(self, maintainability: bool = True):
+        self.maintainability = maintainability
+
+    def analyze(self, path: str, source: str) -> Any:
+        return complexity.analyze_source(path, source, self.maintainability)
+
+    def summarize(self, results: Iterable[Any]) -> dict:
+        return complexity.summarize(results)
+
+
+class BanditPass:
+    """Security issues via Bandit."""
+
+    name = "security"
+
+    def analyze(self, path: str, source: str) -> Any:
+        return security.scan_source(path, source)
+
+    def summarize(self, results: Iterable[Any]) -> dict:
+        return security.summarize(row for rows in results for row in rows)
+
+
+def _scan_one(passes: Sequence[Any], path: str) -> Optional[Tuple[Any, ...]]:
+    """Read one file and run every pass over it; None if unreadable."""
+    try:
+        source = read_source(path)
+    except Exception:
+        return None
+    return tuple(p.analyze(path, source) for p in passes)
+
+
+class UnifiedScanner:
+    """Walk a tree once and run several per-file analysis passes on it."""
+
+    def __init__(self, passes: Sequence[Any], workers: Optional[int] = None):
+        self.passes = list(passes)
+        self.workers = workers
+
+    def scan(self, files: Iterable[str]) -> Iterator[Optional[Tuple[Any, ...]]]:
+        """Yield every pass's result for each file in-process; None if unreadable."""
+        for p in files:
+            yield _scan_one(self.passes, p)
+
+    def run(self, path: str) -> Dict[str, dict]:
+        """Scan ``path`` and return each pass's summary keyed by pass name."""
+        # Sorted to match the order calculate_complexity() and analyze_security() use.
+        files = sorted(iter_python_files(path))
+
+        if self.workers == 1 or len(files) < MIN_FILES_FOR_POOL:
+            per_file: List[Optional[Tuple[Any, ...]]] = list(self.scan(files))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers or os.cpu_count()) as ex:
+                per_file = list(ex.map(partial(_scan_one, self.passes), files, chunksize=16))
+
+        per_pass: List[List[Any]] = [[] for _ in self.passes]
+        for res in per_file:
+            if res is None:
+                continue
+            for i, r in enumerate(res):
+                per_pass[i].append(r)
+
+        return {p.name: p.summarize(results) for p, results in zip(self.passes, per_pass)}
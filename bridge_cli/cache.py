@@ -0,0 +1,129 @@
+"""On-disk cache of analysis results keyed by repository and commit.
+
+Results are stored as JSON in a small SQLite database under
+``~/.cache/bridge-cli`` (or ``$BRIDGE_CACHE_DIR``). Every helper fails soft:
+a cache that cannot be read or written behaves like a miss.
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import time
+from typing import Any, Optional
+
+from bridge_cli import __version__
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore
+
+# Bump when analyzer output changes shape or meaning so stale rows are ignored.
+CACHE_VERSION = 5
+
+# Churn and release cadence are relative to "now", so results go stale even
+# when HEAD does not move.
+DEFAULT_MAX_AGE = 24 * 3600
+
+
+def cache_dir() -> str:
+    """Directory holding Bridge's cache files."""
+    override = os.getenv("BRIDGE_CACHE_DIR")
+    if override:
+        return override
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bridge-cli")
+
+
+def _connect() -> sqlite3.Connection:
+    d = cache_dir()
+    os.makedirs(d, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(d, "results.sqlite"), timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, created REAL, value TEXT)")
+    return conn
+
+
+def head_sha(path: str) -> Optional[str]:
+    """Commit SHA of HEAD for a clean Git checkout, else None.
+
+    Non-Git directories and working trees with uncommitted changes return
+    None because their contents are not pinned by a commit. Untracked
+    files count as changes (ignored ones do not): the analyzers walk the
+    filesystem, not the index.
+    """
+    try:
+        sha = subprocess.run(
+            ["git", "-C", path, "rev-parse", "--verify", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "-C", path, "status", "--porcelain", "--untracked-files=normal"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return None if dirty else sha or None
+
+
+def is_shallow(path: str) -> bool:
+    """True for a shallow clone, whose history stops before the root commit."""
+    try:
+        out = subprocess.run(
+            ["git", "-C", path, "rev-parse", "--is-shallow-repository"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return out == "true"
+
+
+def make_key(repo_ref: str, sha: str, shallow: bool = False) -> str:
+    """Cache key for ``repo_ref`` at ``sha`` under the current analyzers.
+
+    History-based metrics (contributors, bus factor, release cadence) only
+    cover the fetched window in a shallow clone, so those results get a
+    key of their own and never stand in for a full-history analysis.
+    """
+    if os.path.isdir(repo_ref):
+        repo_ref = os.path.abspath(repo_ref)
+    key = f"{repo_ref}@{sha}@{__version__}.{CACHE_VERSION}"
+    return key + "@shallow" if shallow else key
+
+
+def get(key: str, max_age: Optional[float] = DEFAULT_MAX_AGE) -> Optional[Any]:
+    """Return the cached value for ``key``, or None if missing or expired."""
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute("SELECT created, value FROM results WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None:
+        return None
+    created, value = row
+    if max_age is not None and time.time() - created > max_age:
+        return None
+    try:
+        return orjson.loads(value) if orjson is not None else json.loads(value)
+    except ValueError:
+        return None
+
+
+def put(key: str, value: Any) -> None:
+    """Store a JSON-serializable ``value`` under ``key``."""
+    try:
+        payload = orjson.dumps(value).decode("utf-8") if orjson is not None else json.dumps(value)
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, created, value) VALUES (?, ?, ?)",
+                    (key, time.time(), payload),
+                )
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error, TypeError, ValueError):
+        pass
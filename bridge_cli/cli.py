@@ -1,37 +1,24 @@
 """Command-line interface for the Bridge CLI tool."""
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
-from rich.table import Table
 from typing import Optional
 
-from bridge_cli.repo_fetcher import fetch_repo
-from bridge_cli.analyzers.complexity import calculate_complexity
-from bridge_cli.analyzers.churn import analyze_churn
-from bridge_cli.analyzers.duplication import analyze_duplication
-from bridge_cli.analyzers.security import analyze_security
-from bridge_cli.report import generate_report
-from bridge_cli.analyzers.overview import (
-    get_repo_name,
-    get_age_days_and_total_commits,
-    language_breakdown,
-    fetch_open_issues,
-    total_lines_of_code,
-)
-from bridge_cli.analyzers.health import analyze_health
-from bridge_cli.ascii_art import LOGO
-import uvicorn
+# Analyzer, Git, Bandit, rich and uvicorn imports are deferred to the
+# commands that use them so `bridge --help` and `bridge --version` start fast.
 
 @click.group(invoke_without_command=True)
 @click.version_option()
 @click.pass_context
 def cli(ctx):
     """Bridge CLI - Analyze technical debt in local or remote Git repositories."""
-    console = Console()
     if ctx.invoked_subcommand is None:
+        from rich.align import Align
+        from rich.console import Console
+        from rich.text import Text
+
+        from bridge_cli.ascii_art import LOGO
+
+        console = Console()
         rich_logo = Text.from_markup(f"[#FF4F00]{LOGO}[/#FF4F00]")
         aligned_logo = Align.center(rich_logo)
         console.print(aligned_logo)
@@ -50,39 +37,37 @@ def cli(ctx):
 @cli.command()
 @click.argument('repo_url')
 @click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write full JSON report to file')
-def analyze(repo_url: str, output: Optional[str] = None):
+@click.option('--no-cache', is_flag=True, help='Ignore cached results for this commit and re-run all analyzers')
+@click.option('--shallow', is_flag=True, help='Clone only recent history (faster; age, commits and contributors cover that window only)')
+def analyze(repo_url: str, output: Optional[str] = None, no_cache: bool = False, shallow: bool = False):
     """
     Analyze technical debt in a Git repository.
 
     REPO_URL can be a remote URL (e.g., 'https://github.com/owner/repo.git')
     or a local path to a repository.
     """
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from bridge_cli.repo_fetcher import fetch_repo
+    from bridge_cli.pipeline import run_analysis
+    from bridge_cli.report import generate_report
+
     try:
-        with fetch_repo(repo_url) as repo_path:
+        with fetch_repo(repo_url, full_history=not shallow) as repo_path:
             console = Console()
             console.print(f"Analyzing repository in [bold]{repo_path}[/bold]...\n")
 
-            # Core analyzers
-            complexity_metrics = calculate_complexity(repo_path)
-            churn_metrics = analyze_churn(repo_path)
-            duplication_metrics = analyze_duplication(repo_path)
-            security_metrics = analyze_security(repo_path)
-            health_metrics = analyze_health(repo_path)
-
-            metrics = {
-                "complexity": complexity_metrics,
-                "churn": churn_metrics,
-                "duplication": duplication_metrics,
-                "security": security_metrics,
-                "health": health_metrics,
-            }
-
-            # Overview
-            repo_name = get_repo_name(repo_url)
-            age_days, total_commits = get_age_days_and_total_commits(repo_path)
-            lang_pct = language_breakdown(repo_path, repo_url)
-            open_issues = fetch_open_issues(repo_url)
-            loc = total_lines_of_code(repo_path)
+            result = run_analysis(repo_path, repo_url, use_cache=not no_cache)
+            metrics = result["metrics"]
+            repo_name = result["name"]
+            age_days, total_commits = result["age_days"], result["commits"]
+            lang_pct, loc, open_issues = result["languages"], result["size_loc"], result["open_issues"]
+
+            complexity_metrics = metrics["complexity"]
+            churn_metrics = metrics["churn"]
+            health_metrics = metrics["health"]
 
             # Optional JSON output file
             if output:
@@ -154,6 +139,8 @@ def analyze(repo_url: str, output: Optional[str] = None):
 @click.option('--port', default=8000, type=int, help='Port to bind')
 def web(host: str, port: int):
     """Run the Bridge web server (FastAPI) and open the dashboard."""
+    import uvicorn
+
     try:
         uvicorn.run("bridge_cli.server:app", host=host, port=port, reload=False, log_level="info")
     except Exception as e:
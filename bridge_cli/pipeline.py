@@ -0,0 +1,130 @@
+"""Runs every analyzer over a fetched repository.
+
+Shared by the CLI and the web server so both produce the same results the
+same way: overview lookups (network- and I/O-bound) and the Git-based
+analyzers run on threads while the unified complexity/security scan uses
+its own process pool. Duplication detection, which also uses a process
+pool, starts after the scan so the two pools never run at once.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bridge_cli import cache as result_cache
+from bridge_cli.analyzers.churn import analyze_churn
+from bridge_cli.analyzers.duplication import analyze_duplication
+from bridge_cli.analyzers.health import analyze_health
+from bridge_cli.analyzers.unified import UnifiedScanner, ComplexityPass, BanditPass
+from bridge_cli.analyzers.overview import (
+    get_repo_name,
+    get_age_days_and_total_commits,
+    language_breakdown,
+    fetch_open_issues,
+    total_lines_of_code,
+    scan_repo,
+)
+
+
+# Receives (result key, value) as each piece of an analysis completes
+ResultCallback = Callable[[str, Any], None]
+
+
+def _on_done(future: Future, on_result: Optional[ResultCallback], split: Callable[[Any], Dict[str, Any]]) -> None:
+    """Report ``future``'s result, as the key/value pairs ``split`` returns, once it succeeds."""
+    if on_result is None:
+        return
+
+    def done(f: Future) -> None:
+        if f.exception() is None:
+            for key, value in split(f.result()).items():
+                on_result(key, value)
+
+    future.add_done_callback(done)
+
+
+def _lines_and_languages(repo_path: str, repo_ref: str) -> Tuple[int, List[Tuple[str, float]]]:
+    """Lines of code and language breakdown from one walk of the tree."""
+    scan = scan_repo(repo_path)
+    return total_lines_of_code(repo_path, scan), language_breakdown(repo_path, repo_ref, scan)
+
+
+def run_analysis(
+    repo_path: str,
+    repo_ref: str,
+    use_cache: bool = True,
+    on_result: Optional[ResultCallback] = None,
+) -> Dict[str, Any]:
+    """
+    Analyzes a checked-out repository.
+
+    Args:
+        repo_path (str): Path to the working tree (from fetch_repo).
+        repo_ref (str): The reference the user gave (URL, owner/repo or path),
+            used for GitHub lookups, the repo name and the cache key.
+        use_cache (bool): Reuse core metrics cached for this commit.
+        on_result (Optional[Callable]): Called as ``on_result(key, value)``
+            for each overview field and each metric as soon as it is ready,
+            possibly from a worker thread. Keys match the returned dict and
+            its "metrics" entry.
+
+    Returns:
+        dict: Overview fields ("name", "age_days", "commits", "languages",
+              "open_issues", "size_loc") and the core analyzer results under
+              "metrics".
+    """
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        # Overview metrics are network- and I/O-bound; start them first
+        # so they overlap with the analyzers. Lines of code and the
+        # language breakdown share one tree scan, so the breakdown never
+        # needs the bounded source probe.
+        age_future = ex.submit(get_age_days_and_total_commits, repo_path)
+        issues_future = ex.submit(fetch_open_issues, repo_ref)
+        lang_loc_future = ex.submit(_lines_and_languages, repo_path, repo_ref)
+        _on_done(age_future, on_result, lambda r: {"age_days": r[0], "commits": r[1]})
+        _on_done(issues_future, on_result, lambda r: {"open_issues": r})
+        _on_done(lang_loc_future, on_result, lambda r: {"size_loc": r[0], "languages": r[1]})
+
+        # Core analyzers (reused when this commit was analyzed recently)
+        sha = result_cache.head_sha(repo_path)
+        cache_key = (
+            result_cache.make_key(repo_ref, sha, shallow=result_cache.is_shallow(repo_path)) if sha else None
+        )
+        metrics = result_cache.get(cache_key) if cache_key and use_cache else None
+        if metrics is None:
+            churn_future = ex.submit(analyze_churn, repo_path)
+            health_future = ex.submit(analyze_health, repo_path)
+            _on_done(churn_future, on_result, lambda r: {"churn": r})
+            _on_done(health_future, on_result, lambda r: {"health": r})
+            scan = UnifiedScanner([ComplexityPass(maintainability=False), BanditPass()]).run(repo_path)
+            if on_result is not None:
+                on_result("complexity", scan["complexity"])
+                on_result("security", scan["security"])
+            # Duplication tokenizes on its own process pool; starting it
+            # once the scan's pool has exited keeps one pool's worth of
+            # processes per CPU instead of two.
+            duplication_future = ex.submit(analyze_duplication, repo_path)
+            _on_done(duplication_future, on_result, lambda r: {"duplication": r})
+            metrics = {
+                "complexity": scan["complexity"],
+                "churn": churn_future.result(),
+                "duplication": duplication_future.result(),
+                "security": scan["security"],
+                "health": health_future.result(),
+            }
+            if cache_key:
+                result_cache.put(cache_key, metrics)
+        elif on_result is not None:
+            for name, value in metrics.items():
+                on_result(name, value)
+
+        age_days, total_commits = age_future.result()
+        loc, lang_pct = lang_loc_future.result()
+        return {
+            "name": get_repo_name(repo_ref),
+            "age_days": age_days,
+            "commits": total_commits,
+            "languages": lang_pct,
+            "open_issues": issues_future.result(),
+            "size_loc": loc,
+            "metrics": metrics,
+        }
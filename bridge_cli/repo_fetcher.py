@@ -6,14 +6,158 @@ Supports:
 - GitHub shorthand in the form "owner/repo"
 """
 
+import datetime
 import os
+import re
 import shutil
+import subprocess
 import tempfile
 from contextlib import contextmanager
-from git import Repo
+from functools import partial
+from typing import List, Optional
+from git.exc import GitCommandError
+
+from bridge_cli import _clone_pool
+
+_CLONE_OPTIONS = ["--filter=blob:none", "--single-branch"]
+
+
+# Shallow clones keep this much history: churn's 30-day window with margin.
+_SHALLOW_DAYS = 60
+# Fallback for servers that reject --shallow-since (or a repo with no commits in the window)
+_SHALLOW_DEPTH = 200
+
+
+def _git_env() -> dict:
+    # Never block on a credential prompt for private or missing repos
+    return dict(os.environ, GIT_TERMINAL_PROMPT="0")
+
+
+def _git_clone(clone_url: str, dest: str, options: List[str]) -> None:
+    """Run ``git clone`` directly; GitPython adds nothing for a one-shot clone.
+
+    Raises:
+        GitCommandError: If git exits non-zero.
+    """
+    cmd = ["git", "clone", *options, "--", clone_url, dest]
+    try:
+        subprocess.run(cmd, capture_output=True, text=True, check=True, stdin=subprocess.DEVNULL, env=_git_env())
+    except subprocess.CalledProcessError as e:
+        raise GitCommandError(cmd, e.returncode, e.stderr) from e
+
+
+def _clone(clone_url: str, dest: str, full_history: bool = True) -> None:
+    """Clone ``clone_url`` into ``dest``, as a blobless partial clone if possible.
+
+    Blobless keeps full commit/tree history (churn, health and age all walk
+    it) and tags (release cadence), but only downloads file contents for the
+    checked-out HEAD. Git older than 2.19 rejects --filter, so retry as a
+    plain full clone in that case.
+
+    With ``full_history=False`` only the last _SHALLOW_DAYS of commits are
+    fetched, falling back to the last _SHALLOW_DEPTH commits.
+    """
+    history: List[str] = []
+    if not full_history:
+        since = datetime.date.today() - datetime.timedelta(days=_SHALLOW_DAYS)
+        history = [f"--shallow-since={since.isoformat()}"]
+    try:
+        _git_clone(clone_url, dest, _CLONE_OPTIONS + history)
+    except GitCommandError as e:
+        stderr = str(e.stderr).lower()
+        if "filter" in stderr:
+            shutil.rmtree(dest, ignore_errors=True)
+            _git_clone(clone_url, dest, history)
+        elif history and "shallow" in stderr:
+            shutil.rmtree(dest, ignore_errors=True)
+            _git_clone(clone_url, dest, _CLONE_OPTIONS + [f"--depth={_SHALLOW_DEPTH}"])
+        else:
+            raise
+
+
+def _update_clone(path: str) -> None:
+    """Move a pooled clone to the remote's current HEAD, with any new tags."""
+    for args in (
+        ["fetch", "--quiet", "--tags", "--force", "origin", "HEAD"],
+        ["reset", "--quiet", "--hard", "FETCH_HEAD"],
+    ):
+        subprocess.run(
+            ["git", "-C", path, *args],
+            capture_output=True, check=True, stdin=subprocess.DEVNULL, env=_git_env(),
+        )
+
+
+def resolve_clone_url(repo_ref: str) -> str:
+    """Turn a remote reference (full Git URL or "owner/repo") into a clone URL.
+
+    Raises:
+        RuntimeError: If ``repo_ref`` is neither a URL nor GitHub shorthand.
+    """
+    # Remote: accept full URLs
+    is_remote = repo_ref.startswith(("http://", "https://", "git://", "ssh://", "git@"))
+
+    # GitHub shorthand owner/repo
+    github_shorthand = ("/" in repo_ref) and not is_remote
+
+    if not (is_remote or github_shorthand):
+        raise RuntimeError(
+            "Invalid repository reference. Provide a local path, a full Git URL, or 'owner/repo'."
+        )
+
+    if github_shorthand:
+        return f"https://github.com/{repo_ref}.git"
+    return repo_ref
+
+
+class RemoteNotFoundError(RuntimeError):
+    """The reference is invalid, or the remote has no such repository or HEAD."""
+
+
+# git's messages for a repository that does not exist (as opposed to one
+# that could not be reached or needs credentials)
+_NOT_FOUND = re.compile(r"not found|does not appear to be a git repository|does not exist", re.IGNORECASE)
+
+
+def remote_head_sha(repo_ref: str) -> Optional[str]:
+    """Commit SHA of a remote's HEAD via ``git ls-remote``, without cloning.
+
+    Returns None for local directories, and when git cannot be run or times
+    out; callers then learn the commit by cloning.
+
+    Raises:
+        RemoteNotFoundError: If the reference is invalid, or git reports the
+            repository or its HEAD missing.
+        RuntimeError: If ls-remote fails for any other reason, such as a
+            network error or a repository that needs credentials.
+    """
+    if os.path.isdir(repo_ref):
+        return None
+    try:
+        url = resolve_clone_url(repo_ref)
+    except RuntimeError as e:
+        raise RemoteNotFoundError(str(e))
+    try:
+        proc = subprocess.run(
+            ["git", "ls-remote", "--exit-code", url, "HEAD"],
+            capture_output=True, text=True, timeout=30,
+            stdin=subprocess.DEVNULL,
+            env=_git_env(),
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    # --exit-code: 2 means the remote answered but has no HEAD (e.g. empty)
+    if proc.returncode == 2:
+        raise RemoteNotFoundError(f"{url} has no HEAD commit")
+    if proc.returncode != 0:
+        detail = proc.stderr.strip()
+        if _NOT_FOUND.search(detail):
+            raise RemoteNotFoundError(detail)
+        raise RuntimeError(f"git ls-remote failed: {detail}")
+    return proc.stdout.split("\t", 1)[0].strip() or None
+
 
 @contextmanager
-def fetch_repo(repo_ref: str):
+def fetch_repo(repo_ref: str, full_history: bool = True, reuse: bool = False):
     """
     Provides a filesystem path for analysis. If given a local path, yields it
     directly. If given a remote reference, clones to a temporary directory and
@@ -24,6 +168,13 @@ def fetch_repo(repo_ref: str):
     Args:
         repo_ref (str): Local directory path, full Git URL, or GitHub
                         shorthand ("owner/repo").
+        full_history (bool): Clone every commit. When False, only recent
+                        history is fetched, so age, commit count and
+                        contributors cover that window only.
+        reuse (bool): Keep the clone in the clone pool afterwards and start
+                        from a pooled clone if there is one (full history
+                        only). Worth it for long-running processes like the
+                        web server.
 
     Yields:
         str: The path to the temporary directory where the repo was cloned.
@@ -36,28 +187,25 @@ def fetch_repo(repo_ref: str):
         yield os.path.abspath(repo_ref)
         return
 
-    # 2) Remote: accept full URLs
-    is_remote = repo_ref.startswith(("http://", "https://", "git://", "ssh://", "git@"))
-
-    # 3) GitHub shorthand owner/repo
-    github_shorthand = ("/" in repo_ref) and not is_remote
+    clone_url = resolve_clone_url(repo_ref)
 
-    if not (is_remote or github_shorthand):
-        raise RuntimeError(
-            "Invalid repository reference. Provide a local path, a full Git URL, or 'owner/repo'."
-        )
-
-    clone_url = repo_ref
-    if github_shorthand:
-        clone_url = f"https://github.com/{repo_ref}.git"
+    if reuse and full_history and _clone_pool.pool_size() > 0:
+        try:
+            with _clone_pool.checkout(clone_url, partial(_clone, clone_url), _update_clone) as path:
+                yield path
+        except Exception as e:
+            raise RuntimeError(f"Failed to clone repository: {e}")
+        return
 
     temp_dir = tempfile.mkdtemp(prefix="bridge-cli-")
     try:
-        Repo.clone_from(clone_url, temp_dir)
+        _clone(clone_url, temp_dir, full_history)
         yield temp_dir
     except Exception as e:
         # Normalize errors for the CLI to display
         raise RuntimeError(f"Failed to clone repository: {e}")
     finally:
         if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
\ No newline at end of file
+            # Remove the clone in the background so the caller can render
+            # results right away.
+            _clone_pool.discard(temp_dir)
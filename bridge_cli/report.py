@@ -3,16 +3,21 @@
 import json
 import datetime
 
-def generate_report(repo_name: str, metrics: dict) -> str:
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore
+
+def build_report(repo_name: str, metrics: dict) -> dict:
     """
-    Generates a detailed JSON report from the collected metrics.
+    Builds the detailed report from the collected metrics.
 
     Args:
         repo_name (str): The name of the repository.
         metrics (dict): A dictionary containing the detailed analysis results.
 
     Returns:
-        str: A JSON string representing the report.
+        dict: The report, ready to be serialized as JSON.
     """
     churn_metrics = metrics.get("churn", {})
     total_commits = churn_metrics.get("total_commits", 0)
@@ -23,12 +28,13 @@ def generate_report(repo_name: str, metrics: dict) -> str:
     security_metrics = metrics.get("security", {})
     health_metrics = metrics.get("health", {})
 
-    report = {
+    return {
         "repo_name": repo_name,
         "timestamp": datetime.datetime.now().isoformat(),
         "metrics": {
             "complexity": {
                 "average": complexity_metrics.get("average_complexity", 0.0),
+                "p50": complexity_metrics.get("p50_complexity", 0.0),
                 "p90": complexity_metrics.get("p90_complexity", 0.0),
                 "top_complex_functions": complexity_metrics.get("top_complex_functions", [])
             },
@@ -57,4 +63,19 @@ def generate_report(repo_name: str, metrics: dict) -> str:
         },
     }
 
-    return json.dumps(report, indent=2) 
\ No newline at end of file
+
+def generate_report(repo_name: str, metrics: dict) -> str:
+    """
+    Generates a detailed JSON report from the collected metrics.
+
+    Args:
+        repo_name (str): The name of the repository.
+        metrics (dict): A dictionary containing the detailed analysis results.
+
+    Returns:
+        str: A JSON string representing the report (see build_report).
+    """
+    report = build_report(repo_name, metrics)
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(report, indent=2)
@@ -1,36 +1,71 @@
 """FastAPI server exposing analysis as HTTP endpoints and serving the web UI."""
 
+import asyncio
+import hashlib
+import json
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
-from bridge_cli.repo_fetcher import fetch_repo
-from bridge_cli.analyzers.complexity import calculate_complexity
-from bridge_cli.analyzers.churn import analyze_churn
-from bridge_cli.analyzers.duplication import analyze_duplication
-from bridge_cli.analyzers.security import analyze_security
-from bridge_cli.analyzers.overview import (
-    get_repo_name,
-    get_age_days_and_total_commits,
-    language_breakdown,
-    fetch_open_issues,
-    total_lines_of_code,
-)
-from bridge_cli.analyzers.health import analyze_health
-from bridge_cli.report import generate_report
+from bridge_cli import cache as result_cache
+from bridge_cli.repo_fetcher import RemoteNotFoundError, fetch_repo, remote_head_sha
+from bridge_cli.pipeline import ResultCallback, run_analysis
+from bridge_cli.report import build_report
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore
+
+
+def _dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class _JSONResponse(JSONResponse):
+    """JSONResponse that encodes with orjson when it is installed.
+
+    FastAPI's own ORJSONResponse is deprecated in recent releases, and the
+    project does not pin FastAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
 
+app = FastAPI(title="Bridge Analyzer API", version="0.1.0", default_response_class=_JSONResponse)
 
-app = FastAPI(title="Bridge Analyzer API", version="0.1.0")
+def _allowed_origins() -> List[str]:
+    """Origins allowed by CORS; ``BRIDGE_ORIGINS`` (comma-separated) overrides "*"."""
+    origins = [o.strip() for o in os.getenv("BRIDGE_ORIGINS", "").split(",") if o.strip()]
+    return origins or ["*"]
 
-# Allow browser access if hosting static separately
+
+# The full JSON report and the UI's JS compress well
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Allow browser access if hosting static separately. Added last so it is
+# outermost: preflights are answered before reaching gzip or the app.
+# Credentials are only allowed for an explicit origin list; a wildcard
+# that reflects any origin with credentials would let every site in.
+_ORIGINS = _allowed_origins()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_ORIGINS,
+    allow_credentials=_ORIGINS != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -41,71 +76,258 @@ def health() -> Dict[str, Any]:
     return {"status": "ok"}
 
 
+def _analysis_workers() -> int:
+    """Concurrent analyses; ``BRIDGE_ANALYSIS_WORKERS`` overrides the default."""
+    try:
+        return max(1, int(os.environ["BRIDGE_ANALYSIS_WORKERS"]))
+    except (KeyError, ValueError):
+        return 2
+
+
+# Analyses run here, off the event loop. Each one already fans its CPU work
+# out to a process pool, so a few threads are enough to keep every core busy.
+_ANALYSIS_POOL = ThreadPoolExecutor(max_workers=_analysis_workers(), thread_name_prefix="bridge-analysis")
+
+
+# Whole /analyze responses, keyed by repo and commit. Open issues and churn
+# drift even when HEAD does not move, so entries expire after an hour.
+_RESPONSE_TTL = 3600
+_RESPONSE_MEMO_SIZE = 128
+_response_memo: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_response_memo_lock = threading.Lock()
+
+
+def _response_key(repo_ref: str, sha: str) -> str:
+    return result_cache.make_key(repo_ref, sha) + "#response"
+
+
+def _cached_response(key: str) -> Optional[Dict[str, Any]]:
+    """Response for ``key`` from memory, then from the on-disk cache."""
+    with _response_memo_lock:
+        item = _response_memo.get(key)
+        if item is not None:
+            created, body = item
+            if time.time() - created <= _RESPONSE_TTL:
+                _response_memo.move_to_end(key)
+                return body
+            del _response_memo[key]
+    body = result_cache.get(key, max_age=_RESPONSE_TTL)
+    if body is not None:
+        _remember_response(key, body)
+    return body
+
+
+def _remember_response(key: str, body: Dict[str, Any]) -> None:
+    with _response_memo_lock:
+        _response_memo[key] = (time.time(), body)
+        _response_memo.move_to_end(key)
+        while len(_response_memo) > _RESPONSE_MEMO_SIZE:
+            _response_memo.popitem(last=False)
+
+
+# In-flight analyses by (repo_ref, HEAD SHA, force_refresh); only touched on
+# the event loop
+_INFLIGHT: Dict[Tuple[str, Optional[str], bool], "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _head_sha(repo_ref: str) -> Optional[str]:
+    """HEAD commit of a local checkout, or of a remote via ``git ls-remote``."""
+    if os.path.isdir(repo_ref):
+        return result_cache.head_sha(repo_ref)
+    return remote_head_sha(repo_ref)
+
+
+async def _resolve_head(repo_ref: str) -> Optional[str]:
+    """_head_sha() off the event loop, with ls-remote failures as HTTP errors.
+
+    None (a local non-Git directory, or git could not be run) means the
+    commit is only known once the analysis has fetched the repository.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, _head_sha, repo_ref)
+    except RemoteNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"Repository not found: {e}")
+    except RuntimeError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
+def _run_analysis(
+    repo_ref: str,
+    sha: Optional[str],
+    force_refresh: bool = False,
+    on_result: Optional[ResultCallback] = None,
+) -> Dict[str, Any]:
+    """Fetch ``repo_ref``, analyze it and build the /analyze response body.
+
+    Repeat requests for a commit (``sha``, from _head_sha) analyzed within
+    the last hour are answered from cache without cloning.
+    ``force_refresh`` skips every cache. ``on_result`` receives partial
+    results as they complete (see run_analysis); cached answers skip it.
+    """
+    if sha and not force_refresh:
+        cached = _cached_response(_response_key(repo_ref, sha))
+        if cached is not None:
+            return cached
+
+    with fetch_repo(repo_ref, reuse=True) as repo_path:
+        result = run_analysis(repo_path, repo_ref, use_cache=not force_refresh, on_result=on_result)
+        metrics = result["metrics"]
+        complexity_metrics = metrics["complexity"]
+        churn_metrics = metrics["churn"]
+        health_metrics = metrics["health"]
+        repo_name = result["name"]
+
+        # Full report (detailed), embedded as an object so the response is
+        # encoded once rather than as a JSON string inside JSON
+        report = build_report(repo_name, metrics)
+
+        body = {
+            "summary": {
+                "name": repo_name,
+                "age_days": result["age_days"],
+                "languages": result["languages"],
+                "open_issues": result["open_issues"],
+                "commits": result["commits"],
+                "churn_30d": {
+                    "commits": churn_metrics.get("total_commits", 0),
+                    "files": churn_metrics.get("total_files_changed", 0),
+                    "weekly": churn_metrics.get("weekly_commits", []),
+                },
+                "complexity": {
+                    "avg": complexity_metrics.get("average_complexity", 0.0),
+                    "p50": complexity_metrics.get("p50_complexity", 0.0),
+                    "p90": complexity_metrics.get("p90_complexity", 0.0),
+                },
+                "size_loc": result["size_loc"],
+                "health": {
+                    "contributors": health_metrics.get("contributors", 0),
+                    "bus_factor": health_metrics.get("bus_factor", 0),
+                    "releases_per_year": health_metrics.get("release_cadence", {}).get("releases_last_year", 0),
+                },
+            },
+            "report": report,
+        }
+
+        # Key on the commit actually analyzed, which may be newer than the
+        # one ls-remote saw if a push landed in between. Lookups happen
+        # before cloning and cannot tell history depth apart, so results
+        # from a shallow checkout are not stored.
+        sha = result_cache.head_sha(repo_path)
+        if sha and not result_cache.is_shallow(repo_path):
+            key = _response_key(repo_ref, sha)
+            _remember_response(key, body)
+            result_cache.put(key, body)
+        return body
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header value covers ``etag``."""
+    if not if_none_match:
+        return False
+    # Weak comparison (RFC 9110): a W/ prefix does not matter here
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or any((c[2:] if c.startswith("W/") else c) == etag for c in candidates)
+
+
 @app.post("/analyze")
-def analyze(payload: Dict[str, str]) -> Dict[str, Any]:
+async def analyze(payload: Dict[str, Any], request: Request) -> Response:
     repo_ref = payload.get("repo")
     if not repo_ref:
         raise HTTPException(status_code=400, detail="Missing 'repo' in body")
 
+    # Resolving HEAD is cheap, so do it before queueing for the analysis
+    # pool: a bad reference fails fast, without a temp dir or clone.
+    sha = await _resolve_head(repo_ref)
+    loop = asyncio.get_running_loop()
+
+    # Identical requests arriving while one is running share its result
+    # instead of cloning and analyzing the same commit again. A forced
+    # refresh never joins a run that may be answered from cache.
+    force_refresh = bool(payload.get("force_refresh"))
+    key = (repo_ref, sha, force_refresh)
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = loop.run_in_executor(_ANALYSIS_POOL, _run_analysis, repo_ref, sha, force_refresh)
+        _INFLIGHT[key] = future
+        future.add_done_callback(lambda f: _INFLIGHT.pop(key, None) if _INFLIGHT.get(key) is f else None)
+
     try:
-        with fetch_repo(repo_ref) as repo_path:
-            # Core analyzers
-            complexity_metrics = calculate_complexity(repo_path)
-            churn_metrics = analyze_churn(repo_path)
-            duplication_metrics = analyze_duplication(repo_path)
-            security_metrics = analyze_security(repo_path)
-            health_metrics = analyze_health(repo_path)
-
-            metrics = {
-                "complexity": complexity_metrics,
-                "churn": churn_metrics,
-                "duplication": duplication_metrics,
-                "security": security_metrics,
-                "health": health_metrics,
-            }
-
-            # Overview
-            repo_name = get_repo_name(repo_ref)
-            age_days, total_commits = get_age_days_and_total_commits(repo_path)
-            lang_pct = language_breakdown(repo_path, repo_ref)
-            open_issues = fetch_open_issues(repo_ref)
-            loc = total_lines_of_code(repo_path)
-
-            # Full JSON report (detailed)
-            json_report = generate_report(repo_name, metrics)
-
-            return {
-                "summary": {
-                    "name": repo_name,
-                    "age_days": age_days,
-                    "languages": lang_pct,
-                    "open_issues": open_issues,
-                    "commits": total_commits,
-                    "churn_30d": {
-                        "commits": churn_metrics.get("total_commits", 0),
-                        "files": churn_metrics.get("total_files_changed", 0),
-                        "weekly": churn_metrics.get("weekly_commits", []),
-                    },
-                    "complexity": {
-                        "avg": complexity_metrics.get("average_complexity", 0.0),
-                        "p90": complexity_metrics.get("p90_complexity", 0.0),
-                    },
-                    "size_loc": loc,
-                    "health": {
-                        "contributors": health_metrics.get("contributors", 0),
-                        "bus_factor": health_metrics.get("bus_factor", 0),
-                        "releases_per_year": health_metrics.get("release_cadence", {}).get("releases_last_year", 0),
-                    },
-                },
-                "report": json_report,
-            }
+        # Shielded so one client disconnecting does not cancel the others
+        body = await asyncio.shield(future)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Identical results for the same commit hash to the same ETag, so a
+    # client that already holds them gets an empty 304 instead.
+    content = _dumps(body)
+    etag = '"' + hashlib.sha256(content).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _sse(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + _dumps(data) + b"\n\n"
+
+
+@app.get("/analyze/stream")
+async def analyze_stream(repo: str, force_refresh: bool = False) -> StreamingResponse:
+    """Server-sent events for one analysis.
+
+    Emits one event per overview field and metric as it completes (named
+    like the keys of run_analysis' result, e.g. "open_issues", "churn"),
+    then "done" with the same body POST /analyze returns, or "error".
+    """
+    sha = await _resolve_head(repo)
+    loop = asyncio.get_running_loop()
+
+    queue: "asyncio.Queue[Optional[Tuple[str, Any]]]" = asyncio.Queue()
+
+    def on_result(name: str, value: Any) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (name, value))
+
+    future = loop.run_in_executor(_ANALYSIS_POOL, _run_analysis, repo, sha, force_refresh, on_result)
+    # Runs on the loop after every call_soon_threadsafe above, so it is last
+    future.add_done_callback(lambda f: queue.put_nowait(None))
+
+    async def events():
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            yield _sse(*item)
+        try:
+            yield _sse("done", future.result())
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+# Asset names carrying a content hash (app.3f9a1c2b.js) never change in place
+_HASHED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+
+
+class _WebFiles(StaticFiles):
+    """StaticFiles with cache headers.
+
+    Hashed assets are cached for a year. Everything else (index.html,
+    app.js) must be revalidated, which is a cheap 304 thanks to the ETag
+    StaticFiles already sends.
+    """
+
+    def file_response(self, full_path, *args, **kwargs):
+        response = super().file_response(full_path, *args, **kwargs)
+        if _HASHED_ASSET.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
 
 # Serve the web UI (static) from /web at root
 _WEB_DIR = Path(__file__).resolve().parent.parent / "web"
 if _WEB_DIR.exists():
-    app.mount("/", StaticFiles(directory=str(_WEB_DIR), html=True), name="web")
-
-
+    app.mount("/", _WebFiles(directory=str(_WEB_DIR), html=True), name="web")
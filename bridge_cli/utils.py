@@ -0,0 +1,65 @@
+"""Filesystem helpers shared by the analyzers."""
+
+import mmap
+import os
+from typing import Iterator
+
+# Directories that never contain first-party sources worth measuring: VCS
+# metadata, virtualenvs and installed packages, build output and tool caches.
+IGNORE_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "venv", "site-packages", "__pycache__",
+    ".tox", ".nox", "dist", "build", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+})
+
+# Files smaller than this are read directly; mapping them costs more than it saves.
+_MMAP_THRESHOLD = 16 * 1024
+
+# Analyzers that fan files out to a process pool work in-process below this
+# many files, where pool start-up costs more than it saves.
+MIN_FILES_FOR_POOL = 16
+
+
+def iter_python_files(root: str) -> Iterator[str]:
+    """Yield paths of ``.py`` files under ``root``, pruning IGNORE_DIRS.
+
+    Uses os.scandir so file/dir checks come from the cached DirEntry type
+    instead of an extra stat per entry. Files in a directory are yielded
+    before its subdirectories are descended, like os.walk.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                # No ignored name ends in ".py", so a name hit can skip the
+                # entry without asking whether it is a directory.
+                if entry.name in IGNORE_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+    except OSError:
+        return
+    for sub in subdirs:
+        yield from iter_python_files(sub)
+
+
+def read_source(path: str) -> str:
+    """Read a source file as text, ignoring undecodable bytes.
+
+    Large files are decoded straight from a read-only mmap, so the raw bytes
+    are never copied into an intermediate Python object. Newlines are
+    normalized to "\\n" to match text-mode reads.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            text = f.read().decode("utf-8", "ignore")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8", "ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
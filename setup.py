@@ -12,7 +12,6 @@ setup(
         "radon",
         "bandit",
         "python-dotenv",
-        "pyfiglet",
         "GitPython",
     ],
     entry_points={
@@ -0,0 +1,42 @@
+import os
+import subprocess
+
+import pytest
+
+APP_SOURCE = "def f(x):\n    if x:\n        return 1\n    return 0\n"
+
+
+def _git(cwd, *args, email="dev@example.com", date=None):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME="Dev",
+        GIT_AUTHOR_EMAIL=email,
+        GIT_COMMITTER_NAME="Dev",
+        GIT_COMMITTER_EMAIL=email,
+    )
+    if date is not None:
+        env["GIT_COMMITTER_DATE"] = f"{date} +0000"
+    return subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def git():
+    """Run git in a directory with a fixed identity and return its stdout.
+
+    ``email`` sets the author and committer email; ``date`` (a Unix
+    timestamp) sets the committer date.
+    """
+    return _git
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A committed repository holding one Python file, with an empty result cache."""
+    monkeypatch.setenv("BRIDGE_CACHE_DIR", str(tmp_path / "cache"))
+    d = tmp_path / "repo"
+    d.mkdir()
+    (d / "app.py").write_text(APP_SOURCE, encoding="utf-8")
+    _git(d, "init", "-q")
+    _git(d, "add", ".")
+    _git(d, "commit", "-q", "-m", "init")
+    return str(d)
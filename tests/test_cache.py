@@ -0,0 +1,51 @@
+import os
+import tempfile
+import time
+
+from bridge_cli import cache
+
+
+def test_cache_roundtrip_and_expiry(monkeypatch):
+    with tempfile.TemporaryDirectory() as d:
+        monkeypatch.setenv("BRIDGE_CACHE_DIR", d)
+        key = cache.make_key("owner/repo", "abc123")
+
+        assert cache.get(key) is None
+        cache.put(key, {"complexity": {"average_complexity": 2.5}})
+        assert cache.get(key) == {"complexity": {"average_complexity": 2.5}}
+
+        monkeypatch.setattr(time, "time", lambda: 10**12)
+        assert cache.get(key) is None
+        assert cache.get(key, max_age=None) is not None
+
+
+def test_head_sha_is_none_outside_git():
+    with tempfile.TemporaryDirectory() as d:
+        with open(os.path.join(d, "a.py"), "w", encoding="utf-8") as f:
+            f.write("x = 1\n")
+        assert cache.head_sha(d) is None
+
+
+def test_shallow_clones_get_their_own_key(repo, git, tmp_path):
+    git(repo, "commit", "-q", "--allow-empty", "-m", "second")
+    clone = tmp_path / "shallow"
+    git(tmp_path, "clone", "-q", "--depth=1", f"file://{repo}", str(clone))
+
+    assert cache.is_shallow(str(clone))
+    assert not cache.is_shallow(repo)
+    assert cache.make_key("owner/repo", "abc", shallow=True) != cache.make_key("owner/repo", "abc")
+
+
+def test_head_sha_treats_untracked_sources_as_dirty(repo, git):
+    with open(os.path.join(repo, ".gitignore"), "w", encoding="utf-8") as f:
+        f.write("build/\n")
+    git(repo, "add", ".gitignore")
+    git(repo, "commit", "-q", "-m", "ignore build")
+    os.makedirs(os.path.join(repo, "build"))
+    with open(os.path.join(repo, "build", "gen.py"), "w", encoding="utf-8") as f:
+        f.write("x = 1\n")
+    assert cache.head_sha(repo) is not None
+
+    with open(os.path.join(repo, "new.py"), "w", encoding="utf-8") as f:
+        f.write("def g():\n    return 1\n")
+    assert cache.head_sha(repo) is None
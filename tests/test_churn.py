@@ -17,3 +17,24 @@ def test_analyze_churn_on_non_git_directory():
         assert result["recent_churned_files"] == []
 
 
+def test_analyze_churn_counts_each_path_once_per_commit(git):
+    with tempfile.TemporaryDirectory() as d:
+        git(d, "init", "-q")
+        os.makedirs(os.path.join(d, "src"))
+        with open(os.path.join(d, "src", "a.py"), "w", encoding="utf-8") as f:
+            f.write("1\n")
+        with open(os.path.join(d, "README"), "w", encoding="utf-8") as f:
+            f.write("hi\n")
+        git(d, "add", "-A")
+        git(d, "commit", "-qm", "root", email="Dev@Example.com")
+        with open(os.path.join(d, "src", "a.py"), "a", encoding="utf-8") as f:
+            f.write("2\n")
+        git(d, "commit", "-qam", "edit")
+
+        result = analyze_churn(d, days=7)
+        assert result["total_commits"] == 2
+        assert result["total_files_changed"] == 2
+        assert result["top_churned_files"][0] == {"path": "src/a.py", "touches": 2}
+        assert {"dir": "src", "touches": 2} in result["top_churned_dirs"]
+        assert result["authors_count"] == 1
+        assert sum(w["commits"] for w in result["weekly_commits"]) == 2
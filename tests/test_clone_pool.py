@@ -0,0 +1,47 @@
+from functools import partial
+
+import pytest
+
+from bridge_cli import _clone_pool, repo_fetcher
+
+
+@pytest.fixture
+def origin(tmp_path, monkeypatch, git):
+    monkeypatch.setattr(_clone_pool, "_idle", type(_clone_pool._idle)())
+    src = tmp_path / "origin"
+    src.mkdir()
+    git(src, "init", "-q")
+    git(src, "commit", "-q", "--allow-empty", "-m", "one")
+    yield src
+    _clone_pool._clear()
+
+
+def _checkout(url):
+    return _clone_pool.checkout(url, partial(repo_fetcher._clone, url), repo_fetcher._update_clone)
+
+
+def test_pooled_clone_is_reused_and_updated(origin, git):
+    url = origin.as_uri()
+    with _checkout(url) as first:
+        assert git(first, "rev-list", "--count", "HEAD").strip() == "1"
+
+    git(origin, "commit", "-q", "--allow-empty", "-m", "two")
+    git(origin, "tag", "v1")
+    with _checkout(url) as second:
+        assert second == first
+        assert git(second, "rev-list", "--count", "HEAD").strip() == "2"
+        assert git(second, "tag").split() == ["v1"]
+
+
+def test_busy_clone_is_not_shared(origin):
+    url = origin.as_uri()
+    with _checkout(url) as first, _checkout(url) as second:
+        assert first != second
+    assert len(_clone_pool._idle) == 1
+
+
+def test_pool_size_bounds_idle_clones(origin, monkeypatch):
+    monkeypatch.setenv("BRIDGE_CLONE_POOL", "0")
+    with _checkout(origin.as_uri()):
+        pass
+    assert not _clone_pool._idle
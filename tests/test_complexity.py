@@ -0,0 +1,122 @@
+import os
+import tempfile
+
+import pytest
+
+from bridge_cli.analyzers.complexity import calculate_complexity
+
+
+def _write(d, name, body):
+    with open(os.path.join(d, name), "w", encoding="utf-8") as f:
+        f.write(body)
+
+
+def test_calculate_complexity_parallel_matches_serial():
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(20):
+            _write(
+                d,
+                f"mod{i}.py",
+                f"def f{i}(x):\n"
+                + "".join(f"    if x == {j}:\n        return {j}\n" for j in range(i % 5))
+                + "    return x\n",
+            )
+
+        serial = calculate_complexity(d, workers=1)
+        parallel = calculate_complexity(d, workers=2)
+
+        assert serial == parallel
+        assert serial["function_count"] == 20
+        assert serial["top_complex_functions"][0]["complexity"] == 5
+
+
+def test_calculate_complexity_without_maintainability():
+    with tempfile.TemporaryDirectory() as d:
+        _write(d, "a.py", "def f(x):\n    if x:\n        return 1\n    return 0\n")
+
+        full = calculate_complexity(d, workers=1)
+        fast = calculate_complexity(d, workers=1, maintainability=False)
+
+        assert full["maintainability"]["worst_files_by_mi"]
+        assert fast["maintainability"] == {"average_mi": 0.0, "worst_files_by_mi": []}
+        assert fast["average_complexity"] == full["average_complexity"] == 2.0
+
+
+def test_treesitter_backend_matches_radon():
+    pytest.importorskip("tree_sitter_python")
+    from radon.visitors import ComplexityVisitor
+    from bridge_cli.analyzers import _ts_complexity
+
+    source = (
+        "import functools\n\n"
+        "@functools.lru_cache()\n"
+        "def f(x, y=1 if True else 2):\n"
+        "    def inner():\n"
+        "        if x:\n"
+        "            return 1\n"
+        "    for i in range(x):\n"
+        "        if i and x or y:\n"
+        "            continue\n"
+        "        elif i:\n"
+        "            break\n"
+        "    else:\n"
+        "        pass\n"
+        "    try:\n"
+        "        assert [a for a in x if a]\n"
+        "    except ValueError:\n"
+        "        pass\n"
+        "    except TypeError:\n"
+        "        pass\n"
+        "    else:\n"
+        "        pass\n"
+        "    return [v for v in y if v if not v] or (lambda z: z if z else 0)\n\n"
+        "class C:\n"
+        "    def method(self):\n"
+        "        return 1\n\n"
+        "async def g(v):\n"
+        "    match v:\n"
+        "        case None:\n"
+        "            pass\n"
+        "        case [a] if a:\n"
+        "            pass\n"
+        "        case _:\n"
+        "            pass\n"
+        "    while v:\n"
+        "        pass\n"
+    )
+    expected = [(fn.complexity, fn.name, fn.lineno) for fn in ComplexityVisitor.from_code(source).functions]
+
+    assert _ts_complexity.function_complexities(source) == expected
+    assert _ts_complexity.function_complexities("def broken(:\n") is None
+
+
+def test_branch_free_source_skips_radon_but_matches_it():
+    from radon.visitors import ComplexityVisitor
+    from bridge_cli.analyzers.complexity import _BRANCHY, analyze_source
+
+    source = (
+        "import os\n\n"
+        "def a():\n    return os.sep\n\n"
+        "class C:\n    def m(self):\n        pass\n\n"
+        "with open(os.devnull) as fh:\n"
+        "    async def b():\n"
+        "        def inner():\n            pass\n"
+    )
+    assert not _BRANCHY.search(source)
+
+    expected = [(fn.complexity, fn.name, fn.lineno) for fn in ComplexityVisitor.from_code(source).functions]
+    assert analyze_source("m.py", source, with_mi=False)[1] == expected
+    assert analyze_source("m.py", "def broken(:\n", with_mi=False) is None
+
+
+def test_percentiles_match_without_numpy(monkeypatch):
+    from array import array
+
+    from bridge_cli.analyzers import complexity
+
+    values = array("d", [1, 7, 2, 2, 9, 4, 1, 3])
+    expected = complexity._percentiles(values, (0.5, 0.9))
+    monkeypatch.setattr(complexity, "np", None)
+
+    assert complexity._percentiles(values, (0.5, 0.9)) == pytest.approx(expected)
+    assert complexity._percentiles(array("d"), (0.5, 0.9)) == [0.0, 0.0]
@@ -0,0 +1,59 @@
+import os
+import tempfile
+
+from bridge_cli.analyzers.duplication import analyze_duplication
+
+_BLOCK = """
+def process(items, threshold):
+    total = 0
+    for item in items:
+        if item.value > threshold:
+            total += item.value * 2
+        elif item.value < 0:
+            total -= abs(item.value)
+        else:
+            total += 1
+    return {"total": total, "count": len(items), "threshold": threshold}
+"""
+
+
+def _write(d, name, body):
+    with open(os.path.join(d, name), "w", encoding="utf-8") as f:
+        f.write(body)
+
+
+def test_analyze_duplication_finds_copied_block():
+    with tempfile.TemporaryDirectory() as d:
+        _write(d, "a.py", "import os\n" + _BLOCK)
+        _write(d, "b.py", "# copy\n\n\n" + _BLOCK + "\nX = 1\n")
+
+        report = analyze_duplication(d)
+
+        assert len(report["duplicated_fragments"]) == 1
+        frag = report["duplicated_fragments"][0]
+        assert frag["first_file"] == os.path.join(d, "a.py") + ":3"
+        assert frag["second_file"] == os.path.join(d, "b.py") + ":5"
+        assert "def process" in frag["fragment"]
+        assert 0 < report["duplication_percentage"] < 100
+
+
+def test_analyze_duplication_without_clones():
+    with tempfile.TemporaryDirectory() as d:
+        _write(d, "a.py", _BLOCK)
+        _write(d, "b.py", "def other():\n    return 42\n")
+
+        report = analyze_duplication(d)
+
+        assert report == {"duplication_percentage": 0.0, "duplicated_fragments": []}
+
+
+def test_analyze_duplication_parallel_matches_serial():
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(20):
+            _write(d, f"mod{i:02}.py", f"# module {i}\n" + ("\n" * i) + (_BLOCK if i % 3 == 0 else f"X = {i}\n"))
+
+        serial = analyze_duplication(d, workers=1)
+        parallel = analyze_duplication(d, workers=2)
+
+        assert serial == parallel
+        assert len(serial["duplicated_fragments"]) == 6
@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+from bridge_cli import _http
+from bridge_cli.analyzers import github_graphql
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _Session:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.posts = 0
+
+    def post(self, *args, **kwargs):
+        self.posts += 1
+        return _Response(self.status_code)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("BRIDGE_CACHE_DIR", str(tmp_path))
+
+
+def test_fetch_overview_needs_a_token(monkeypatch):
+    session = _Session(200)
+    monkeypatch.setattr(_http, "SESSION", session)
+
+    assert github_graphql.fetch_overview("owner/repo", None) is None
+    assert session.posts == 0
+
+
+def test_fetch_overview_does_not_cache_failures(monkeypatch):
+    session = _Session(502)
+    monkeypatch.setattr(_http, "SESSION", session)
+
+    assert github_graphql.fetch_overview("owner/repo", "tok") is None
+    assert github_graphql.fetch_overview("owner/repo", "tok") is None
+    assert session.posts == 2
+
+
+def test_slow_lookup_only_blocks_callers_for_the_same_repo(monkeypatch):
+    release = threading.Event()
+    posts = []
+
+    class _OkResponse:
+        status_code = 200
+        content = b""
+
+    class _SlowSession:
+        def post(self, url, json, headers, timeout):
+            posts.append(json["variables"]["name"])
+            if json["variables"]["name"] == "slow":
+                release.wait(5)
+            return _OkResponse()
+
+    monkeypatch.setattr(_http, "SESSION", _SlowSession())
+    monkeypatch.setattr(_http, "decode_json", lambda resp: {"data": {"repository": {
+        "issues": {"totalCount": 1},
+        "pullRequests": {"totalCount": 0},
+        "languages": {"edges": []},
+    }}})
+
+    slow = [threading.Thread(target=github_graphql.fetch_overview, args=("o/slow", "tok")) for _ in range(2)]
+    for t in slow:
+        t.start()
+    try:
+        # Another repository is not held up by the pending lookup
+        assert github_graphql.fetch_overview("o/fast", "tok") == {"open_issues": 1, "languages": {}}
+    finally:
+        release.set()
+        for t in slow:
+            t.join(5)
+
+    # The two concurrent lookups for o/slow shared one request
+    assert sorted(posts) == ["fast", "slow"]
+    assert github_graphql._LOCKS == {}
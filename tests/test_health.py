@@ -0,0 +1,27 @@
+import os
+import tempfile
+
+from bridge_cli.analyzers.health import analyze_health
+
+
+def test_analyze_health_counts_authors_and_tags(git):
+    with tempfile.TemporaryDirectory() as d:
+        git(d, "init", "-q")
+        for i, email in enumerate(["A@Example.com", "a@example.com", "b@example.com"]):
+            git(d, "commit", "-q", "--allow-empty", "-m", f"c{i}", email=email)
+        git(d, "tag", "v1", "HEAD~1")
+        git(d, "tag", "-a", "v2", "-m", "release")
+
+        result = analyze_health(d)
+
+        assert result["contributors"] == 2
+        assert result["top_authors"][0] == {"author": "a@example.com", "commits": 2}
+        assert result["bus_factor"] == 1
+        assert result["release_cadence"]["releases_last_year"] == 2
+
+
+def test_analyze_health_on_non_git_directory():
+    with tempfile.TemporaryDirectory() as d:
+        result = analyze_health(d)
+        assert result["contributors"] == 0
+        assert result["top_authors"] == []
@@ -0,0 +1,196 @@
+import json
+import os
+import tempfile
+import time
+
+import pytest
+
+from bridge_cli import _http
+from bridge_cli.analyzers import overview
+
+
+def _write_bytes(d, name, data):
+    path = os.path.join(d, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def test_count_lines_matches_text_mode_iteration():
+    with tempfile.TemporaryDirectory() as d:
+        for i, data in enumerate([b"", b"a", b"a\n", b"a\nb", b"a\r\nb\r\n", b"a\rb\rc", b"a\r", b"\n\n"]):
+            fp = _write_bytes(d, f"f{i}.py", data)
+            with open(fp, "r", encoding="utf-8", errors="ignore") as f:
+                expected = sum(1 for _ in f)
+            assert overview._count_lines(fp) == expected, data
+
+
+def test_scan_repo_reports_bytes_and_lines_and_prunes_ignored_dirs():
+    with tempfile.TemporaryDirectory() as d:
+        _write_bytes(d, "a.py", b"x = 1\ny = 2\n")
+        _write_bytes(d, os.path.join("pkg", "b.js"), b"let z = 3;")
+        _write_bytes(d, "notes.txt", b"ignored\n")
+        _write_bytes(d, os.path.join("node_modules", "dep.js"), b"ignored\n")
+
+        assert overview._local_language_bytes(d) == {"Python": 12, "JavaScript": 10}
+        assert overview.total_lines_of_code(d) == 3
+
+
+def test_scan_repo_threaded_matches_serial(monkeypatch):
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(6):
+            _write_bytes(d, os.path.join(f"pkg{i}", "sub", "m.py"), b"a\n" * (i + 1))
+            _write_bytes(d, os.path.join(f"pkg{i}", "s.sh"), b"echo\n")
+        _write_bytes(d, "top.py", b"a\n")
+
+        monkeypatch.setenv("BRIDGE_SCAN_WORKERS", "1")
+        serial = overview.scan_repo(d)
+        monkeypatch.setenv("BRIDGE_SCAN_WORKERS", "4")
+        threaded = overview.scan_repo(d)
+
+        assert serial == threaded == ({"Python": 44, "Shell": 30}, 28)
+
+
+class _FakeResponse:
+    def __init__(self, status_code, data=None, etag=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = {"ETag": etag} if etag else {}
+        self.content = json.dumps(data).encode("utf-8")
+
+    def json(self):
+        return self._data
+
+
+class _FakeSession:
+    def __init__(self, get=None, post=None):
+        self.get = get
+        self.post = post
+
+
+def test_github_get_revalidates_with_etag(monkeypatch):
+    calls = []
+
+    def fake_get(url, headers, timeout):
+        calls.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return _FakeResponse(304)
+        return _FakeResponse(200, {"Python": 100}, etag='"v1"')
+
+    with tempfile.TemporaryDirectory() as d:
+        monkeypatch.setenv("BRIDGE_CACHE_DIR", d)
+        monkeypatch.setattr(_http, "SESSION", _FakeSession(fake_get))
+        url = "https://api.github.com/repos/o/r/languages"
+
+        assert overview._github_get_json(url, "tok", ttl=3600) == {"Python": 100}
+        assert overview._github_get_json(url, "tok", ttl=3600) == {"Python": 100}
+        assert len(calls) == 1
+
+        assert overview._github_get_json(url, "tok", ttl=0) == {"Python": 100}
+        assert len(calls) == 2
+        assert calls[1]["If-None-Match"] == '"v1"'
+
+
+def test_age_and_total_commits_use_oldest_root_commit(git):
+    with tempfile.TemporaryDirectory() as d:
+        now = int(time.time())
+        git(d, "init", "-q")
+        for i, days_ago in enumerate([10, 3, 1]):
+            git(d, "commit", "-q", "--allow-empty", "-m", f"c{i}", date=now - days_ago * 86400)
+
+        assert overview.get_age_days_and_total_commits(d) == (10, 3)
+
+
+def test_line_count_skips_binary_and_oversized_files(monkeypatch):
+    monkeypatch.setattr(overview, "_MAX_FILE_BYTES", 64)
+    with tempfile.TemporaryDirectory() as d:
+        _write_bytes(d, "ok.py", b"a\nb\n")
+        _write_bytes(d, "blob.c", b"\x00\x01\n\n\n")
+        _write_bytes(d, "dump.sql", b"x\n" * 100)
+
+        totals, lines = overview.scan_repo(d)
+
+        assert lines == 2
+        assert totals == {"Python": 4, "C": 5, "SQL": 200}
+
+
+@pytest.mark.parametrize(
+    "ref, expected",
+    [
+        ("owner/repo", "owner/repo"),
+        ("owner/repo.git", "owner/repo"),
+        ("https://github.com/owner/repo", "owner/repo"),
+        ("https://github.com/owner/repo.git", "owner/repo"),
+        ("https://github.com/owner/repo/tree/main", "owner/repo"),
+        ("git@github.com:owner/repo.git", "owner/repo"),
+        ("ssh://git@github.com/owner/repo.git", "owner/repo"),
+        ("https://github.com/owner", None),
+        ("https://gitlab.com/owner/repo", None),
+        ("a/b/c", None),
+        ("/abs/path", None),
+    ],
+)
+def test_parse_github_full_name(ref, expected):
+    assert overview.parse_github_full_name(ref) == expected
+
+
+def test_given_scan_is_reused_and_nothing_is_memoized():
+    with tempfile.TemporaryDirectory() as d:
+        _write_bytes(d, "a.py", b"a\n")
+        scan = overview.scan_repo(d)
+
+        _write_bytes(d, "b.py", b"b\nc\n")
+        assert overview.total_lines_of_code(d, scan) == 1
+        assert overview.total_lines_of_code(d) == 3
+
+
+def test_graphql_overview_serves_issues_and_languages_in_one_request(monkeypatch):
+    posts = []
+
+    def fake_post(url, json, headers, timeout):
+        posts.append(json["variables"])
+        return _FakeResponse(200, {"data": {"repository": {
+            "issues": {"totalCount": 3},
+            "pullRequests": {"totalCount": 2},
+            "languages": {"edges": [{"size": 900, "node": {"name": "Python"}}, {"size": 100, "node": {"name": "Shell"}}]},
+        }}})
+
+    def fail_get(*args, **kwargs):
+        raise AssertionError("REST should not be used when GraphQL succeeds")
+
+    with tempfile.TemporaryDirectory() as d:
+        monkeypatch.setenv("BRIDGE_CACHE_DIR", d)
+        monkeypatch.setenv("GITHUB_TOKEN", "tok")
+        monkeypatch.setattr(_http, "SESSION", _FakeSession(get=fail_get, post=fake_post))
+
+        assert overview.fetch_open_issues("owner/repo") == 5
+        assert overview.language_breakdown(d, "owner/repo") == [("Python", 90.0), ("Shell", 10.0)]
+        assert posts == [{"owner": "owner", "name": "repo"}]
+
+
+def test_language_probe_gives_up_on_asset_only_trees(monkeypatch):
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(5):
+            _write_bytes(d, f"img{i}.png", b"\x89PNG")
+        _write_bytes(d, os.path.join("deep", "late.py"), b"x = 1\n")
+
+        monkeypatch.setenv("BRIDGE_LANG_PROBE", "3")
+        assert overview._local_language_bytes(d) == {}
+
+        monkeypatch.setenv("BRIDGE_LANG_PROBE", "0")
+        assert overview._local_language_bytes(d) == {"Python": 6}
+
+
+def test_large_asset_directory_does_not_hide_sources():
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(600):
+            _write_bytes(d, os.path.join("assets", f"img{i:03}.png"), b"\x89PNG")
+        _write_bytes(d, os.path.join("src", "pkg", "mod.py"), b"a = 1\nb = 2\n")
+
+        # The probe alone is fooled, but never zeroes line counts, and a
+        # breakdown given the full walk does not consult it.
+        scan = overview.scan_repo(d)
+        assert overview._local_language_bytes(d) == {}
+        assert overview.total_lines_of_code(d, scan) == 2
+        assert overview.language_breakdown(d, d, scan) == [("Python", 100.0)]
@@ -0,0 +1,52 @@
+import os
+
+from bridge_cli import pipeline
+from bridge_cli.pipeline import run_analysis
+
+
+def test_run_analysis_collects_overview_and_metrics(repo):
+    result = run_analysis(repo, repo)
+
+    assert result["name"] == os.path.basename(repo)
+    assert result["commits"] == 1
+    assert result["languages"] == [("Python", 100.0)]
+    assert result["size_loc"] == 4
+    assert set(result["metrics"]) == {"complexity", "churn", "duplication", "security", "health"}
+    assert result["metrics"]["complexity"]["average_complexity"] == 2.0
+
+    # Second run is served from the cache for this commit
+    assert run_analysis(repo, repo)["metrics"] == result["metrics"]
+
+
+def test_shallow_run_does_not_feed_full_history_cache(repo, git, tmp_path):
+    git(repo, "commit", "-q", "--allow-empty", "-m", "second", email="other@example.com")
+    clone = tmp_path / "shallow"
+    git(tmp_path, "clone", "-q", "--depth=1", f"file://{repo}", str(clone))
+
+    shallow = run_analysis(str(clone), "owner/repo")
+    full = run_analysis(repo, "owner/repo")
+
+    assert shallow["metrics"]["health"]["contributors"] == 1
+    assert full["metrics"]["health"]["contributors"] == 2
+
+
+def test_duplication_pool_starts_after_the_scan_pool(repo, monkeypatch):
+    events = []
+    scan = pipeline.UnifiedScanner.run
+    duplication = pipeline.analyze_duplication
+
+    def run(self, path):
+        events.append("scan start")
+        result = scan(self, path)
+        events.append("scan end")
+        return result
+
+    def analyze_duplication(path):
+        events.append("duplication start")
+        return duplication(path)
+
+    monkeypatch.setattr(pipeline.UnifiedScanner, "run", run)
+    monkeypatch.setattr(pipeline, "analyze_duplication", analyze_duplication)
+    run_analysis(repo, repo, use_cache=False)
+
+    assert events == ["scan start", "scan end", "duplication start"]
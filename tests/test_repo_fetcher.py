@@ -0,0 +1,104 @@
+import os
+import subprocess
+import threading
+
+import pytest
+from git.exc import GitCommandError
+
+from bridge_cli import repo_fetcher
+
+
+def test_clone_falls_back_to_full_clone_when_filter_unsupported(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_git_clone(url, dest, options):
+        calls.append(options)
+        if options:
+            raise GitCommandError(["git", "clone"], 129, b"error: unknown option `filter=blob:none'")
+
+    monkeypatch.setattr(repo_fetcher, "_git_clone", fake_git_clone)
+    repo_fetcher._clone("https://example.com/o/r.git", str(tmp_path / "r"))
+
+    assert calls == [repo_fetcher._CLONE_OPTIONS, []]
+
+
+def test_clone_does_not_retry_other_failures(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_git_clone(url, dest, options):
+        calls.append(options)
+        raise GitCommandError(["git", "clone"], 128, b"fatal: repository not found")
+
+    monkeypatch.setattr(repo_fetcher, "_git_clone", fake_git_clone)
+    with pytest.raises(GitCommandError):
+        repo_fetcher._clone("https://example.com/o/r.git", str(tmp_path / "r"))
+    assert calls == [repo_fetcher._CLONE_OPTIONS]
+
+
+def test_shallow_clone_falls_back_to_depth(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_git_clone(url, dest, options):
+        calls.append(options)
+        if any(o.startswith("--shallow-since") for o in options):
+            raise GitCommandError(["git", "clone"], 128, b"fatal: error processing shallow info: 4")
+
+    monkeypatch.setattr(repo_fetcher, "_git_clone", fake_git_clone)
+    repo_fetcher._clone("https://example.com/o/r.git", str(tmp_path / "r"), full_history=False)
+
+    assert calls[0][-1].startswith("--shallow-since=")
+    assert calls[1] == repo_fetcher._CLONE_OPTIONS + ["--depth=200"]
+
+
+def test_fetch_repo_removes_clone_after_use(monkeypatch):
+    def fake_clone(url, dest, full_history):
+        with open(os.path.join(dest, "a.py"), "w", encoding="utf-8") as f:
+            f.write("x = 1\n")
+
+    monkeypatch.setattr(repo_fetcher, "_clone", fake_clone)
+    with repo_fetcher.fetch_repo("owner/repo") as path:
+        assert os.listdir(path) == ["a.py"]
+
+    for t in threading.enumerate():
+        if t is not threading.current_thread():
+            t.join(timeout=5)
+    assert not os.path.exists(path)
+
+
+def test_git_clone_raises_git_command_error(tmp_path):
+    with pytest.raises(GitCommandError):
+        repo_fetcher._git_clone(str(tmp_path / "missing"), str(tmp_path / "dest"), [])
+
+
+def test_remote_head_sha_skips_local_dirs_and_rejects_invalid_refs(tmp_path):
+    assert repo_fetcher.remote_head_sha(str(tmp_path)) is None
+    with pytest.raises(repo_fetcher.RemoteNotFoundError):
+        repo_fetcher.remote_head_sha("not-a-repo")
+
+
+def test_remote_head_sha_tells_missing_repos_from_failures(repo, git, tmp_path, monkeypatch):
+    # file:// remotes stand in for a server
+    monkeypatch.setattr(repo_fetcher, "resolve_clone_url", lambda ref: ref)
+    assert repo_fetcher.remote_head_sha(f"file://{repo}") == git(repo, "rev-parse", "HEAD").strip()
+
+    with pytest.raises(repo_fetcher.RemoteNotFoundError):
+        repo_fetcher.remote_head_sha(f"file://{tmp_path}/missing")
+    git(tmp_path, "init", "-q", "--bare", "empty.git")
+    with pytest.raises(repo_fetcher.RemoteNotFoundError):
+        repo_fetcher.remote_head_sha(f"file://{tmp_path}/empty.git")
+
+    # Failures that say nothing about the repository are not "not found"
+    def unreachable(*args, **kwargs):
+        return subprocess.CompletedProcess(args, 128, "", "fatal: Could not resolve host: example.com")
+
+    monkeypatch.setattr(repo_fetcher.subprocess, "run", unreachable)
+    with pytest.raises(RuntimeError) as excinfo:
+        repo_fetcher.remote_head_sha("https://example.com/o/r.git")
+    assert not isinstance(excinfo.value, repo_fetcher.RemoteNotFoundError)
+
+    # Without a usable git (or on timeout) the commit is left to the clone
+    def no_git(*args, **kwargs):
+        raise FileNotFoundError("git")
+
+    monkeypatch.setattr(repo_fetcher.subprocess, "run", no_git)
+    assert repo_fetcher.remote_head_sha("https://example.com/o/r.git") is None
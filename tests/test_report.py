@@ -1,5 +1,5 @@
 import json
-from bridge_cli.report import generate_report
+from bridge_cli.report import build_report, generate_report
 
 
 def test_generate_report_structure():
@@ -57,3 +57,14 @@ def test_generate_report_structure():
     assert isinstance(m["security"]["detailed_issues"], list)
 
 
+
+
+def test_generate_report_serializes_build_report():
+    metrics = {"complexity": {"average_complexity": 2.0}, "churn": {"total_commits": 3}}
+
+    built = build_report("example-repo", metrics)
+    data = json.loads(generate_report("example-repo", metrics))
+
+    built.pop("timestamp")
+    data.pop("timestamp")
+    assert data == built
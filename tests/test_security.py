@@ -0,0 +1,60 @@
+import os
+import tempfile
+
+from bridge_cli.analyzers.security import _bandit_scan_chunk, analyze_security, scan_source
+
+
+def test_analyze_security_sharded_matches_serial():
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(60):
+            with open(os.path.join(d, f"mod{i:02d}.py"), "w", encoding="utf-8") as f:
+                f.write("import subprocess\n\n")
+                if i % 10 == 0:
+                    f.write("subprocess.call(user_input, shell=True)\n")
+
+        serial = analyze_security(d, workers=1)
+        sharded = analyze_security(d, workers=3)
+
+        assert serial == sharded
+        assert serial["issues_by_severity"]["high"] == 6
+        assert [i["file"] for i in serial["detailed_issues"]] == sorted(i["file"] for i in serial["detailed_issues"])
+
+
+def test_reused_manager_does_not_carry_results_between_scans():
+    with tempfile.TemporaryDirectory() as d:
+        bad = os.path.join(d, "bad.py")
+        with open(bad, "w", encoding="utf-8") as f:
+            f.write("import subprocess\nsubprocess.call(user_input, shell=True)\n")
+
+        first = _bandit_scan_chunk([bad])
+        second = _bandit_scan_chunk([bad])
+
+        assert first == second
+        assert scan_source(bad, "x = 1\n") == []
+
+
+def test_analyze_security_without_python_files(monkeypatch):
+    import bridge_cli.analyzers.security as security
+
+    monkeypatch.setattr(security, "_bandit_scan_chunk", lambda files: 1 / 0)
+    with tempfile.TemporaryDirectory() as d:
+        with open(os.path.join(d, "app.js"), "w", encoding="utf-8") as f:
+            f.write("eval(input)\n")
+        assert analyze_security(d) == {"issues_by_severity": {"high": 0, "medium": 0, "low": 0}, "detailed_issues": []}
+
+
+def test_concurrent_scans_do_not_share_results():
+    from concurrent.futures import ThreadPoolExecutor
+
+    bad = "import subprocess\n" + "subprocess.call(user_input, shell=True)\n" * 200
+    expected_bad = scan_source("bad.py", bad)
+    assert len(expected_bad) > 200
+
+    def scan(i):
+        return scan_source("bad.py", bad) if i % 2 else scan_source("clean.py", "x = 1\n")
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        results = list(ex.map(scan, range(40)))
+
+    for i, rows in enumerate(results):
+        assert rows == (expected_bad if i % 2 else [])
@@ -0,0 +1,207 @@
+import json
+
+import pytest
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+from bridge_cli.server import app
+
+
+def test_analyze_requires_repo():
+    assert TestClient(app).post("/analyze", json={}).status_code == 400
+
+
+def test_analyze_local_repo(repo):
+    resp = TestClient(app).post("/analyze", json={"repo": repo})
+
+    assert resp.status_code == 200
+    summary = resp.json()["summary"]
+    assert summary["commits"] == 1
+    assert summary["size_loc"] == 4
+    assert summary["complexity"]["avg"] == 2.0
+    assert resp.json()["report"]["metrics"]["complexity"]["average"] == 2.0
+
+
+def test_analyze_reuses_cached_response(repo, monkeypatch):
+    import bridge_cli.server as server
+
+    client = TestClient(app)
+    first = client.post("/analyze", json={"repo": repo}).json()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("pipeline ran")
+
+    monkeypatch.setattr(server, "run_analysis", fail)
+    assert client.post("/analyze", json={"repo": repo}).json() == first
+
+    resp = client.post("/analyze", json={"repo": repo, "force_refresh": True})
+    assert resp.json()["detail"] == "pipeline ran"
+
+
+def test_analyze_answers_matching_etag_with_304(repo):
+    client = TestClient(app)
+    first = client.post("/analyze", json={"repo": repo})
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=60"
+
+    again = client.post("/analyze", json={"repo": repo}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+
+def test_static_files_are_revalidated_and_compressed():
+    client = TestClient(app)
+
+    index = client.get("/")
+    assert index.headers["cache-control"] == "no-cache"
+
+    script = client.get("/app.js", headers={"Accept-Encoding": "gzip"})
+    assert script.headers["content-encoding"] == "gzip"
+    assert client.get("/app.js", headers={"If-None-Match": script.headers["etag"]}).status_code == 304
+
+
+def test_analyze_missing_remote_is_404_without_cloning(monkeypatch):
+    import bridge_cli.server as server
+    from bridge_cli.repo_fetcher import RemoteNotFoundError
+
+    def no_clone(*args, **kwargs):
+        raise AssertionError("should not clone")
+
+    def missing(ref):
+        raise RemoteNotFoundError("remote: Repository not found.")
+
+    monkeypatch.setattr(server, "remote_head_sha", missing)
+    monkeypatch.setattr(server, "fetch_repo", no_clone)
+
+    resp = TestClient(app).post("/analyze", json={"repo": "nobody/nothing"})
+    assert resp.status_code == 404
+
+
+def test_analyze_ls_remote_failures_are_not_404(monkeypatch):
+    import bridge_cli.server as server
+
+    def unreachable(ref):
+        raise RuntimeError("git ls-remote failed: Could not resolve host: github.com")
+
+    def clone_fails(*args, **kwargs):
+        raise RuntimeError("Failed to clone repository: git not installed")
+
+    client = TestClient(app)
+    monkeypatch.setattr(server, "remote_head_sha", unreachable)
+    resp = client.post("/analyze", json={"repo": "o/r"})
+    assert resp.status_code == 502
+    assert "Could not resolve host" in resp.json()["detail"]
+
+    # No commit from ls-remote (git missing, timeout): the clone reports the cause
+    monkeypatch.setattr(server, "remote_head_sha", lambda ref: None)
+    monkeypatch.setattr(server, "fetch_repo", clone_fails)
+    resp = client.post("/analyze", json={"repo": "o/r"})
+    assert resp.status_code == 500
+    assert "git not installed" in resp.json()["detail"]
+
+
+def test_default_response_class_encodes_without_orjson(monkeypatch):
+    import bridge_cli.server as server
+
+    with_orjson = server._JSONResponse({"a": [1, 2.5, "é"]}).body
+    monkeypatch.setattr(server, "orjson", None)
+
+    assert server._JSONResponse({"a": [1, 2.5, "é"]}).body == with_orjson
+    assert TestClient(app).get("/health").json() == {"status": "ok"}
+
+
+def test_concurrent_identical_requests_share_one_analysis(monkeypatch):
+    import asyncio
+    import threading
+
+    from starlette.requests import Request
+
+    import bridge_cli.server as server
+
+    calls = []
+    release = threading.Event()
+
+    def slow_analysis(repo_ref, sha, force_refresh=False):
+        calls.append(repo_ref)
+        release.wait(5)
+        return {"summary": {"name": repo_ref}}
+
+    monkeypatch.setattr(server, "_head_sha", lambda ref: "abc123")
+    monkeypatch.setattr(server, "_run_analysis", slow_analysis)
+    request = Request({"type": "http", "headers": []})
+
+    async def run():
+        first = asyncio.ensure_future(server.analyze({"repo": "o/r"}, request))
+        second = asyncio.ensure_future(server.analyze({"repo": "o/r"}, request))
+        await asyncio.sleep(0.1)
+        release.set()
+        return await asyncio.gather(first, second)
+
+    first, second = asyncio.run(run())
+    assert first.body == second.body
+    assert calls == ["o/r"]
+    assert server._INFLIGHT == {}
+
+
+def test_analyze_stream_emits_partial_results_then_done(repo):
+    resp = TestClient(app).get("/analyze/stream", params={"repo": repo})
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [line[len("event: "):] for line in resp.text.splitlines() if line.startswith("event: ")]
+    assert {"age_days", "commits", "languages", "size_loc", "complexity", "churn", "health"} <= set(events)
+    assert events[-1] == "done"
+    done = resp.text.rsplit("data: ", 1)[1]
+    assert json.loads(done)["summary"]["size_loc"] == 4
+
+
+def test_cors_preflight_without_credentials_by_default():
+    resp = TestClient(app).options(
+        "/analyze",
+        headers={"Origin": "https://example.com", "Access-Control-Request-Method": "POST"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in resp.headers
+
+
+def test_allowed_origins_from_env(monkeypatch):
+    import bridge_cli.server as server
+
+    monkeypatch.setenv("BRIDGE_ORIGINS", "https://a.example, https://b.example,")
+    assert server._allowed_origins() == ["https://a.example", "https://b.example"]
+
+
+def test_force_refresh_does_not_join_a_normal_analysis(monkeypatch):
+    import asyncio
+    import threading
+
+    from starlette.requests import Request
+
+    import bridge_cli.server as server
+
+    calls = []
+    release = threading.Event()
+
+    def slow_analysis(repo_ref, sha, force_refresh=False):
+        calls.append(force_refresh)
+        release.wait(5)
+        return {"summary": {"fresh": force_refresh}}
+
+    monkeypatch.setattr(server, "_head_sha", lambda ref: "abc123")
+    monkeypatch.setattr(server, "_run_analysis", slow_analysis)
+    request = Request({"type": "http", "headers": []})
+
+    async def run():
+        normal = asyncio.ensure_future(server.analyze({"repo": "o/r"}, request))
+        forced = asyncio.ensure_future(server.analyze({"repo": "o/r", "force_refresh": True}, request))
+        await asyncio.sleep(0.1)
+        release.set()
+        return await asyncio.gather(normal, forced)
+
+    normal, forced = asyncio.run(run())
+    assert json.loads(normal.body) == {"summary": {"fresh": False}}
+    assert json.loads(forced.body) == {"summary": {"fresh": True}}
+    assert sorted(calls) == [False, True]
@@ -0,0 +1,20 @@
+import os
+import tempfile
+
+from bridge_cli.analyzers.complexity import calculate_complexity
+from bridge_cli.analyzers.security import analyze_security
+from bridge_cli.analyzers.unified import BanditPass, ComplexityPass, UnifiedScanner
+
+
+def test_unified_scan_matches_individual_analyzers():
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(20):
+            with open(os.path.join(d, f"mod{i:02d}.py"), "w", encoding="utf-8") as f:
+                f.write("import subprocess\n\n")
+                f.write(f"def run{i}(cmd):\n    if cmd:\n        subprocess.call(cmd, shell=True)\n")
+
+        for workers in (1, 2):
+            result = UnifiedScanner([ComplexityPass(), BanditPass()], workers=workers).run(d)
+
+            assert result["complexity"] == calculate_complexity(d, workers=1)
+            assert result["security"] == analyze_security(d, workers=1)
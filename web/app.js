@@ -32,7 +32,7 @@ function renderSummary(s) {
     card('open issues', s.open_issues == null ? 'N/A' : s.open_issues),
     card('commits', s.commits ?? 0),
     card('churn (30d)', `${s.churn_30d?.commits ?? 0} commits, ${s.churn_30d?.files ?? 0} files`),
-    card('complexity', `avg ${s.complexity?.avg ?? 0}, p90 ${s.complexity?.p90 ?? 0}`),
+    card('complexity', `avg ${s.complexity?.avg ?? 0}, p50 ${s.complexity?.p50 ?? 0}, p90 ${s.complexity?.p90 ?? 0}`),
     card('size', `${s.size_loc ?? 0} lines of code`),
     card('contributors', s.health?.contributors ?? 0),
     card('bus factor', s.health?.bus_factor ?? 0),